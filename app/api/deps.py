@@ -1,24 +1,28 @@
+import asyncio
 from typing import Optional
-from uuid import UUID
 
 from fastapi import Depends, HTTPException, Query
 from fastapi.security import OAuth2PasswordBearer
 
 from app.repositories.user import UserRepository
-from app.services.user import create_anonymous_user, get_user, get_user_from_token
+from app.services.user import (
+    create_anonymous_user,
+    get_user,
+    get_user_from_token_async,
+)
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token", auto_error=False)
 
 
-def get_current_user(token: str = Depends(oauth2_scheme)):
+async def get_current_user(token: str = Depends(oauth2_scheme)):
     """Get current user from token (for registered users only)"""
-    user = get_user_from_token(token)
+    user = await get_user_from_token_async(token)
     if not user:
         raise HTTPException(status_code=401, detail="Invalid token")
     return user
 
 
-def get_current_user_or_create_anonymous(
+async def get_current_user_or_create_anonymous(
     token: Optional[str] = Depends(oauth2_scheme),
     id: Optional[str] = Query(None, description="User id (UUID) for anonymous access"),
 ):
@@ -36,42 +40,44 @@ def get_current_user_or_create_anonymous(
         )
     if token:
         # Registered user with token
-        user = get_user_from_token(token)
+        user = await get_user_from_token_async(token)
         if not user or not user.email:
             raise HTTPException(
                 status_code=401, detail="Invalid token or not a registered user"
             )
         return user
     elif id:
-        # Validate id as UUID
-        try:
-            UUID(id)
-        except Exception:
-            raise HTTPException(
-                status_code=400, detail="Invalid UUID format for user id"
-            )
-        # Check if user exists
-        userdb = get_user(id, by="id")
-        if userdb:
-            if userdb.email:
-                # If user has email, must use token
-                raise HTTPException(
-                    status_code=401,
-                    detail="Registered user must use token authentication",
-                )
-            return UserRepository.userdb_to_user(userdb)
-        else:
-            # Create new anonymous user with provided id
-            return create_anonymous_user(id)
+        # Database lookups run in a worker thread to keep the event loop free
+        return await asyncio.to_thread(_get_or_create_anonymous_user, id)
     else:
         raise HTTPException(
             status_code=400, detail="Must provide either token or id (UUID)"
         )
 
 
-def get_registered_user(token: str = Depends(oauth2_scheme)):
+def _get_or_create_anonymous_user(id: str):
+    """Find an existing anonymous user by id or create a new one"""
+    # Check if user exists
+    userdb = get_user(id, by="id")
+    if userdb:
+        if userdb.email:
+            # If user has email, must use token
+            raise HTTPException(
+                status_code=401,
+                detail="Registered user must use token authentication",
+            )
+        return UserRepository.userdb_to_user(userdb)
+    else:
+        # Create new anonymous user with provided id (validated as UUID there)
+        try:
+            return create_anonymous_user(id)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+
+async def get_registered_user(token: str = Depends(oauth2_scheme)):
     """Get current registered user (must have valid token and email)."""
-    user = get_user_from_token(token)
+    user = await get_user_from_token_async(token)
     if not user or not user.email:
         raise HTTPException(
             status_code=401, detail="Authentication required (registered user only)"
@@ -81,23 +81,26 @@ def mark_notifications_as_read_api(
         )
 
     # Verify all notifications belong to the current user
+    owners = NotificationRepository.get_notification_owners(notification_ids)
     for notification_id in notification_ids:
-        notification = NotificationRepository.get_notifications_by_id(notification_id)
-        if not notification:
+        owner_id = owners.get(notification_id)
+        if owner_id is None:
             raise HTTPException(
                 status_code=404, detail=f"Notification {notification_id} not found"
             )
-        if notification.user_id != user.id:
+        if owner_id != user.id:
             raise HTTPException(
                 status_code=403,
                 detail=f"Notification {notification_id} does not belong to current user",
             )
 
-    # Mark notifications as read
-    success_count = 0
-    for notification_id in notification_ids:
-        if NotificationRepository.mark_as_read(notification_id):
-            success_count += 1
+    # Mark notifications as read. Every id was checked above, so like the old
+    # one-UPDATE-per-id loop, already-read notifications count as marked too
+    success_count = (
+        len(notification_ids)
+        if NotificationRepository.mark_many_as_read(user.id, notification_ids)
+        else 0
+    )
 
     return {
         "message": f"Successfully marked {success_count} out of {len(notification_ids)} notifications as read",
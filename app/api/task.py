@@ -1,4 +1,6 @@
-from fastapi import Depends, HTTPException, Path
+from typing import List
+
+from fastapi import BackgroundTasks, Body, Depends, HTTPException, Path
 
 from app.api.deps import get_current_user_or_create_anonymous
 from app.core.api_decorator import delete_route, get_route, post_route, put_route
@@ -7,6 +9,7 @@ from app.repositories.task import TaskRepository
 from app.repositories.user import UserRepository
 from app.schemas.task import (
     CreateTaskRequest,
+    Task,
     TaskListResponse,
     TaskResponse,
     UpdateTaskFields,
@@ -14,16 +17,31 @@ from app.schemas.task import (
 )
 from app.schemas.user import User
 from app.services.notification_manager import NotificationManager
-from app.services.reminder_utils import should_send_task_notification
 from app.services.task import (
     delete_task,
     get_tasks_for_user,
     update_task,
     update_task_status,
 )
-from app.utils.safe_block import safe_block
+from app.utils.safe_block import run_safely, safe_block
 from app.utils.user import get_actual_linked_carereceiver_id
 
+# Upper bound for a single bulk create, keeps one request's insert batch small
+MAX_BULK_TASKS = 100
+
+
+def _notify_task_group(user_id: str, tasks: List[Task], notification_type: str):
+    """Notify the executor's group about task events, run after the response"""
+    group_user_ids = UserRepository.get_group_user_ids(user_id)
+    NotificationManager.notify_task_group_bulk(
+        user_ids=group_user_ids,
+        executor_user_id=user_id,
+        task_ids=[task.id for task in tasks],
+        notification_type=notification_type,
+        # This request already knows the titles, so skip looking them up again
+        task_titles={task.id: task.title for task in tasks},
+    )
+
 
 @get_route(
     path="/tasks",
@@ -45,6 +63,7 @@ def get_tasks(user: User = Depends(get_current_user_or_create_anonymous)):
     tags=["task"],
 )
 def create_task(
+    background_tasks: BackgroundTasks,
     user: User = Depends(get_current_user_or_create_anonymous),
     req: CreateTaskRequest = None,
 ):
@@ -67,23 +86,71 @@ def create_task(
             reminder_time=reminder_time,
         )
 
-    # Safely add notification
-    with safe_block("task creation notification"):
-        group_user_ids = UserRepository.get_group_user_ids(user.id)
-        for user_in_group in group_user_ids:
-            # Check user's reminder settings before sending notification
-            if user_in_group != user.id and should_send_task_notification(
-                user_in_group, "create"
-            ):
-                NotificationManager.notify_task_created(
-                    user_id=user_in_group,
-                    executor_user_id=user.id,
-                    task_id=task.id,
-                )
+    # Notify the group once the response has been sent
+    background_tasks.add_task(
+        run_safely,
+        "task creation notification",
+        _notify_task_group,
+        user.id,
+        [task],
+        "create",
+    )
 
     return TaskResponse(task=task)
 
 
+@post_route(
+    path="/tasks/bulk",
+    summary="Create Tasks",
+    description="Create several tasks for the current user in one request.",
+    response_model=TaskListResponse,
+    tags=["task"],
+)
+def create_tasks(
+    background_tasks: BackgroundTasks,
+    user: User = Depends(get_current_user_or_create_anonymous),
+    reqs: List[CreateTaskRequest] = Body(
+        ..., max_length=MAX_BULK_TASKS, description="Tasks to create"
+    ),
+):
+    if not reqs:
+        raise HTTPException(status_code=400, detail="Task list cannot be empty")
+
+    # Get actual task owner ID
+    actual_owner_id = get_actual_linked_carereceiver_id(user.id, user.role)
+    if not actual_owner_id:
+        raise HTTPException(
+            status_code=400, detail="No linked carereceiver found for caregiver"
+        )
+
+    tasks = TaskRepository.create_tasks(actual_owner_id, reqs, user.id)
+
+    # Safely log the task creations
+    with safe_block("task creation logging"):
+        for req in reqs:
+            reminder_time = (
+                f"{req.reminder_time.hour:02d}:{req.reminder_time.minute:02d}"
+            )
+            ActivityLogRepository.log_task_create(
+                user_id=user.id,
+                target_user_id=actual_owner_id,
+                task_title=req.title,
+                reminder_time=reminder_time,
+            )
+
+    # Notify the group once the response has been sent, one batch for all tasks
+    background_tasks.add_task(
+        run_safely,
+        "task creation notification",
+        _notify_task_group,
+        user.id,
+        tasks,
+        "create",
+    )
+
+    return TaskListResponse(tasks=tasks)
+
+
 @get_route(
     path="/tasks/{task_id}",
     summary="Get Task by ID",
@@ -113,6 +180,7 @@ def get_task(
     tags=["task"],
 )
 def update_task_api(
+    background_tasks: BackgroundTasks,
     user: User = Depends(get_current_user_or_create_anonymous),
     task_id: str = Path(...),
     updates: UpdateTaskFields = None,
@@ -152,19 +220,15 @@ def update_task_api(
                 updated_fields=updated_fields,
             )
 
-    # Safely add notification for task update
-    with safe_block("task update notification"):
-        group_user_ids = UserRepository.get_group_user_ids(user.id)
-        for user_in_group in group_user_ids:
-            # Check user's reminder settings before sending notification
-            if user_in_group != user.id and should_send_task_notification(
-                user_in_group, "update"
-            ):
-                NotificationManager.notify_task_updated(
-                    user_id=user_in_group,
-                    executor_user_id=user.id,
-                    task_id=task.id,
-                )
+    # Notify the group about the update once the response has been sent
+    background_tasks.add_task(
+        run_safely,
+        "task update notification",
+        _notify_task_group,
+        user.id,
+        [task],
+        "update",
+    )
 
     return TaskResponse(task=task)
 
@@ -177,6 +241,7 @@ def update_task_api(
     tags=["task"],
 )
 def update_task_status_api(
+    background_tasks: BackgroundTasks,
     user: User = Depends(get_current_user_or_create_anonymous),
     task_id: str = Path(...),
     status: UpdateTaskStatusRequest = None,
@@ -203,20 +268,16 @@ def update_task_status_api(
             completed=status.completed,
         )
 
-    # Safely add notification for task completed
-    with safe_block("task completed notification"):
-        if status.completed is True:
-            group_user_ids = UserRepository.get_group_user_ids(user.id)
-            for user_in_group in group_user_ids:
-                # Check user's reminder settings before sending notification
-                if user_in_group != user.id and should_send_task_notification(
-                    user_in_group, "complete"
-                ):
-                    NotificationManager.notify_task_completed(
-                        user_id=user_in_group,
-                        executor_user_id=user.id,
-                        task_id=task.id,
-                    )
+    # Notify the group about task completed once the response has been sent
+    if status.completed is True:
+        background_tasks.add_task(
+            run_safely,
+            "task completed notification",
+            _notify_task_group,
+            user.id,
+            [task],
+            "complete",
+        )
 
     return TaskResponse(task=task)
 
@@ -228,6 +289,7 @@ def update_task_status_api(
     tags=["task"],
 )
 def delete_task_api(
+    background_tasks: BackgroundTasks,
     user: User = Depends(get_current_user_or_create_anonymous),
     task_id: str = Path(...),
 ):
@@ -252,18 +314,14 @@ def delete_task_api(
             task_title=original_task.title,
         )
 
-    # Safely add notification for task deleted
-    with safe_block("task deletion notification"):
-        group_user_ids = UserRepository.get_group_user_ids(user.id)
-        for user_in_group in group_user_ids:
-            # Check user's reminder settings before sending notification
-            if user_in_group != user.id and should_send_task_notification(
-                user_in_group, "delete"
-            ):
-                NotificationManager.notify_task_deleted(
-                    user_id=user_in_group,
-                    executor_user_id=user.id,
-                    task_id=task_id,
-                )
+    # Notify the group about task deleted once the response has been sent
+    background_tasks.add_task(
+        run_safely,
+        "task deletion notification",
+        _notify_task_group,
+        user.id,
+        [original_task],
+        "delete",
+    )
 
     return {"message": "Task deleted successfully"}
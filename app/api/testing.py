@@ -0,0 +1,87 @@
+"""
+Test-only endpoints, registered by app.main only when ENVIRONMENT=test
+"""
+
+import uuid
+
+from fastapi import HTTPException
+from nanoid import generate
+
+from app.core.api_decorator import post_route
+from app.repositories.invitation import InvitationRepository
+from app.repositories.user import UserRepository
+from app.schemas.auth import RegisterRequest
+from app.schemas.testing import BootstrapRequest, BootstrapResponse, BootstrapUser
+from app.schemas.user import Role
+from app.services.link import LinkService
+from app.services.security import create_access_token
+from app.services.user import create_user
+
+# Password of every test user (tests/conftest.py uses the same constant)
+TEST_PASSWORD = "test123456"
+
+
+def link_by_invitation(inviter_id: str, invitee_id: str) -> tuple[bool, str]:
+    """
+    Link two carereceivers the way accepting an invitation does, without HTTP:
+    the invitee becomes the caregiver. Shared by /testing/bootstrap and the tests.
+    Returns (success, message).
+    """
+    invitation = InvitationRepository.create_invitation(inviter_id)
+    if not invitation:
+        return False, "Failed to create invitation"
+    # Same order as the accept endpoint: the invitee's role changes first
+    if not UserRepository.update_user_role(invitee_id, Role.CAREGIVER):
+        return False, "Failed to update invitee role to CAREGIVER"
+    success, message, _ = LinkService.accept_invitation(
+        invitation.invitation_code, invitee_id
+    )
+    return success, message
+
+
+@post_route(
+    path="/testing/bootstrap",
+    summary="Bootstrap Test Users",
+    description="Register users and link them in one request (test environment only).",
+    response_model=BootstrapResponse,
+    tags=["testing"],
+)
+def bootstrap(request: BootstrapRequest):
+    # Check the link indices before creating anything
+    for link in request.links:
+        if not all(0 <= index < len(request.users) for index in link):
+            raise HTTPException(status_code=400, detail="Link refers to unknown user")
+
+    users = []
+    try:
+        for role in request.users:
+            user = create_user(
+                RegisterRequest(
+                    id=str(uuid.uuid4()),
+                    email=f"test_{generate(size=8)}@example.com",
+                    role=role,
+                    password=TEST_PASSWORD,
+                )
+            )
+            users.append(
+                BootstrapUser(
+                    id=user.id,
+                    email=user.email,
+                    token=create_access_token({"sub": user.id}),
+                )
+            )
+
+        for inviter_index, invitee_index in request.links:
+            success, message = link_by_invitation(
+                users[inviter_index].id, users[invitee_index].id
+            )
+            if not success:
+                raise ValueError(message)
+    except Exception:
+        # All or nothing: the helpers don't share a transaction, so delete the
+        # users created so far (their settings, invitations and links cascade)
+        for user in users:
+            UserRepository.delete_user(user.id)
+        raise
+
+    return BootstrapResponse(users=users)
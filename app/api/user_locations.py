@@ -1,4 +1,4 @@
-from fastapi import Depends, HTTPException
+from fastapi import BackgroundTasks, Depends, HTTPException
 
 from app.api.deps import get_registered_user
 from app.core.api_decorator import get_route, post_route
@@ -13,8 +13,7 @@ from app.schemas.user_locations import (
 )
 from app.services.location_utils import is_within_safe_zone
 from app.services.notification_manager import NotificationManager
-from app.services.reminder_utils import should_send_safe_zone_notification
-from app.utils.safe_block import safe_block
+from app.utils.safe_block import run_safely
 
 
 @get_route(
@@ -62,6 +61,7 @@ def get_linked_location(target_email: str, user: User = Depends(get_registered_u
 )
 def update_location(
     location: UserLocationCreate,
+    background_tasks: BackgroundTasks,
     user: User = Depends(get_registered_user),
 ):
     # Unregistered user cannot update location
@@ -82,11 +82,16 @@ def update_location(
     if not ok:
         raise HTTPException(status_code=500, detail="Failed to update location.")
 
-    # Safely check safe zone and send notifications if needed
-    with safe_block("safe zone notification"):
-        _check_safe_zone_and_notify(
-            user, location.latitude, location.longitude, previous_location
-        )
+    # Check safe zone and send notifications if needed, after the response is sent
+    background_tasks.add_task(
+        run_safely,
+        "safe zone notification",
+        _check_safe_zone_and_notify,
+        user,
+        location.latitude,
+        location.longitude,
+        previous_location,
+    )
 
     loc = UserLocationsRepository.get_location(user.id)
     return loc
@@ -144,12 +149,8 @@ def _check_safe_zone_and_notify(
         links = UserRepository.get_user_links(user.id, user.role)
         for link in links:
             linked_user = UserRepository.get_user(link["email"], by="email")
-            # Check if caregiver wants safe zone notifications
-            if (
-                linked_user
-                and linked_user.role == Role.CAREGIVER
-                and should_send_safe_zone_notification(linked_user.id)
-            ):
+            # Reminder settings are checked inside notify_safezone_warning
+            if linked_user and linked_user.role == Role.CAREGIVER:
                 NotificationManager.notify_safezone_warning(
                     user_id=linked_user.id,
                     monitor_user_id=user.id,
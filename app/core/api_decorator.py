@@ -36,16 +36,18 @@ def api_route(
             raise ValueError(f"API {path} must provide summary")
         if not description:
             raise ValueError(f"API {path} must provide description")
+        # Decided once per route instead of on every call
+        wrap_result = not is_list_response_model(response_model)
 
         if inspect.iscoroutinefunction(func):
 
             @wraps(func)
             async def wrapper(*args, **kwargs):
                 try:
-                    logger.info(f"API called: {method} {path}")
+                    logger.info("API called: %s %s", method, path)
                     result = await func(*args, **kwargs)
                     # Only wrap if not a list response model
-                    if not is_list_response_model(response_model):
+                    if wrap_result:
                         if not isinstance(result, BaseModel):
                             if isinstance(result, dict):
                                 result = BaseResponse(
@@ -56,7 +58,7 @@ def api_route(
                                     message="Operation successful",
                                     data={"result": result},
                                 )
-                    logger.info(f"API success: {method} {path}")
+                    logger.info("API success: %s %s", method, path)
                     return result
                 except HTTPException as e:
                     logger.warning(f"HTTP error in {path}: {e.detail}")
@@ -84,10 +86,10 @@ def api_route(
             @wraps(func)
             def wrapper(*args, **kwargs):
                 try:
-                    logger.info(f"API called: {method} {path}")
+                    logger.info("API called: %s %s", method, path)
                     result = func(*args, **kwargs)
                     # Only wrap if not a list response model
-                    if not is_list_response_model(response_model):
+                    if wrap_result:
                         if not isinstance(result, BaseModel):
                             if isinstance(result, dict):
                                 result = BaseResponse(
@@ -98,7 +100,7 @@ def api_route(
                                     message="Operation successful",
                                     data={"result": result},
                                 )
-                    logger.info(f"API success: {method} {path}")
+                    logger.info("API success: %s %s", method, path)
                     return result
                 except HTTPException as e:
                     logger.warning(f"HTTP error in {path}: {e.detail}")
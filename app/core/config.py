@@ -25,6 +25,7 @@ class Settings(BaseSettings):
     secret_key: str = ""
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
+    bcrypt_rounds: int = 12
 
     # Speech-to-Text
     assemblyai_api_key: str = ""
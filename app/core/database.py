@@ -1,4 +1,6 @@
 import logging
+import threading
+import time
 
 import mysql.connector
 
@@ -8,6 +10,15 @@ from .config import settings
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Per-thread connection and prepared cursors for execute_prepared_query
+_thread_local = threading.local()
+# Every thread's prepared connection, so they can all be closed on shutdown
+_prepared_connections = set()
+_prepared_connections_lock = threading.Lock()
+# Ping a prepared connection that sat idle this long before reusing it, well
+# below MySQL's default wait_timeout
+PREPARED_IDLE_PING_SECONDS = 60
+
 
 def test_connection() -> bool:
     """Test database connection"""
@@ -75,3 +86,113 @@ def execute_update(query: str, params: tuple = None) -> int:
     except Exception as e:
         logger.error(f"Update execution error: {e}")
         raise
+
+
+def _get_prepared_cursor(query: str):
+    """Get this thread's prepared cursor for a query, connecting on first use"""
+    target = (settings.db_host, settings.db_port, settings.db_name, settings.db_user)
+    connection = getattr(_thread_local, "connection", None)
+    if (
+        connection is not None
+        and time.monotonic() - _thread_local.last_used > PREPARED_IDLE_PING_SECONDS
+    ):
+        # The server may have dropped an idle connection; prepared statements
+        # don't survive a reconnect, so start over if the ping fails
+        try:
+            connection.ping()
+        except mysql.connector.Error:
+            connection = None
+    if connection is None or _thread_local.target != target:
+        _reset_thread_connection()
+        connection = mysql.connector.connect(
+            host=settings.db_host,
+            port=settings.db_port,
+            database=settings.db_name,
+            user=settings.db_user,
+            password=settings.db_password,
+            charset=settings.db_charset,
+            # Long-lived connection: don't keep a stale read snapshot open
+            autocommit=True,
+        )
+        _thread_local.connection = connection
+        _thread_local.target = target
+        _thread_local.cursors = {}
+        with _prepared_connections_lock:
+            _prepared_connections.add(connection)
+    _thread_local.last_used = time.monotonic()
+
+    cursor = _thread_local.cursors.get(query)
+    if cursor is None:
+        cursor = connection.cursor(prepared=True, dictionary=True)
+        _thread_local.cursors[query] = cursor
+    return cursor
+
+
+def _reset_thread_connection():
+    """Drop this thread's prepared cursors and connection"""
+    connection = getattr(_thread_local, "connection", None)
+    _thread_local.connection = None
+    _thread_local.cursors = {}
+    if connection is not None:
+        with _prepared_connections_lock:
+            _prepared_connections.discard(connection)
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+
+def close_prepared_connections():
+    """Close every thread's prepared connection, e.g. on application shutdown"""
+    with _prepared_connections_lock:
+        connections = list(_prepared_connections)
+        _prepared_connections.clear()
+    for connection in connections:
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+
+def execute_prepared_query(query: str, params: tuple = None):
+    """
+    Execute a hot read-only query as a server-side prepared statement and return results.
+    The statement is prepared once per thread and reused, so later calls only send
+    the parameters. Falls back to a fresh connection once if the old one was lost.
+    """
+    for attempt in range(2):
+        try:
+            cursor = _get_prepared_cursor(query)
+            cursor.execute(query, params or ())
+            return cursor.fetchall()
+        except (mysql.connector.InterfaceError, mysql.connector.OperationalError) as e:
+            _reset_thread_connection()
+            if attempt:
+                logger.error(f"Prepared query execution error: {e}")
+                raise
+        except Exception as e:
+            logger.error(f"Prepared query execution error: {e}")
+            raise
+
+
+def execute_many(query: str, params_list: list) -> int:
+    """Execute a query once per parameter set in a single batch and return affected rows"""
+    try:
+        connection = mysql.connector.connect(
+            host=settings.db_host,
+            port=settings.db_port,
+            database=settings.db_name,
+            user=settings.db_user,
+            password=settings.db_password,
+            charset=settings.db_charset,
+        )
+        cursor = connection.cursor()
+        cursor.executemany(query, params_list)
+        affected_rows = cursor.rowcount
+        connection.commit()
+        cursor.close()
+        connection.close()
+        return affected_rows
+    except Exception as e:
+        logger.error(f"Batch execution error: {e}")
+        raise
@@ -1,3 +1,5 @@
+import os
+
 from dotenv import load_dotenv
 from fastapi import APIRouter, FastAPI
 
@@ -17,10 +19,13 @@ from app.api import (
     user_locations,
 )
 from app.core.api_decorator import auto_register_routes
+from app.core.database import close_prepared_connections
 
 load_dotenv()
 
 app = FastAPI()
+# Threads keep their prepared-statement connection open between requests
+app.add_event_handler("shutdown", close_prepared_connections)
 
 router = APIRouter()
 auto_register_routes(router, auth)
@@ -36,6 +41,10 @@ auto_register_routes(router, user_locations)
 auto_register_routes(router, places)
 auto_register_routes(router, activity_log)
 auto_register_routes(router, notification)
+if os.getenv("ENVIRONMENT") == "test":
+    from app.api import testing
+
+    auto_register_routes(router, testing)
 app.include_router(router)
 
 # Include SSE router in
@@ -3,7 +3,7 @@ import uuid
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from app.core.database import execute_query, execute_update
+from app.core.database import execute_many, execute_query, execute_update
 from app.schemas.notification import (
     NotificationCategory,
     NotificationData,
@@ -51,6 +51,61 @@ class NotificationRepository:
             print(f"Error creating notification: {e}")
             return None
 
+    @staticmethod
+    def create_notifications_bulk(
+        notifications: List[Dict[str, Any]],
+    ) -> List[NotificationData]:
+        """
+        Create several notifications in one batch insert.
+        Each item takes the same keys as create_notification's arguments.
+        Returns the created notifications, or an empty list on failure.
+        """
+        if not notifications:
+            return []
+        try:
+            now = datetime.now()
+            created = [
+                NotificationData(
+                    id=str(uuid.uuid4()),
+                    user_id=n["user_id"],
+                    category=n["category"],
+                    message=n["message"],
+                    payload=n.get("payload"),
+                    level=n.get("level", NotificationLevel.GENERAL),
+                    is_read=False,
+                    created_at=now,
+                )
+                for n in notifications
+            ]
+            sql = """
+            INSERT INTO notifications (id, user_id, category, message, payload, level, is_read, created_at)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+            """
+            execute_many(
+                sql,
+                [
+                    (
+                        n.id,
+                        n.user_id,
+                        n.category.value,
+                        n.message,
+                        (
+                            None
+                            if n.payload is None
+                            else json.dumps(n.payload, ensure_ascii=False)
+                        ),
+                        n.level.value,
+                        False,
+                        now,
+                    )
+                    for n in created
+                ],
+            )
+            return created
+        except Exception as e:
+            print(f"Error creating notifications: {e}")
+            return []
+
     @staticmethod
     def get_notifications_by_user(
         user_id: str,
@@ -175,6 +230,37 @@ class NotificationRepository:
             print(f"Error marking notification as read: {e}")
             return False
 
+    @staticmethod
+    def get_notification_owners(notification_ids: List[str]) -> Dict[str, str]:
+        """Map each existing notification id to its user_id, in one query"""
+        if not notification_ids:
+            return {}
+        try:
+            placeholders = ", ".join(["%s"] * len(notification_ids))
+            sql = f"SELECT id, user_id FROM notifications WHERE id IN ({placeholders})"
+            results = execute_query(sql, tuple(notification_ids))
+            return {row["id"]: row["user_id"] for row in results}
+        except Exception as e:
+            print(f"Error getting notification owners: {e}")
+            return {}
+
+    @staticmethod
+    def mark_many_as_read(user_id: str, notification_ids: List[str]) -> bool:
+        """Mark a user's notifications as read in one UPDATE"""
+        if not notification_ids:
+            return True
+        try:
+            placeholders = ", ".join(["%s"] * len(notification_ids))
+            sql = f"""
+            UPDATE notifications SET is_read = TRUE
+            WHERE user_id = %s AND id IN ({placeholders})
+            """
+            execute_update(sql, (user_id, *notification_ids))
+            return True
+        except Exception as e:
+            print(f"Error marking notifications as read: {e}")
+            return False
+
     @staticmethod
     def delete_notification(notification_id: str) -> bool:
         """Delete a notification by id"""
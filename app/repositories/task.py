@@ -8,13 +8,83 @@ from typing import List, Optional
 
 from nanoid import generate
 
-from app.core.database import execute_query, execute_update
+from app.core.database import execute_many, execute_query, execute_update
 from app.schemas.task import CreateTaskRequest, Task, TaskDB, UpdateTaskFields
 
+_INSERT_TASK_SQL = """
+INSERT INTO tasks (
+    id, user_id, title, icon, reminder_hour, reminder_minute,
+    recurrence_interval, recurrence_unit,
+    recurrence_days_of_week, recurrence_days_of_month,
+    completed, created_by, updated_by
+)
+VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
 
 class TaskRepository:
     """Repository for task data access operations"""
 
+    @staticmethod
+    def _new_task_row(
+        task_id: str, user_id: str, task_create: CreateTaskRequest, operator_id: str
+    ) -> tuple:
+        """Build the INSERT parameters for a new task"""
+        # Prepare recurrence data
+        recurrence_interval = None
+        recurrence_unit = None
+        recurrence_days_of_week = None
+        recurrence_days_of_month = None
+
+        if task_create.recurrence:
+            recurrence_interval = task_create.recurrence.interval
+            recurrence_unit = task_create.recurrence.unit.value
+            recurrence_days_of_week = (
+                json.dumps(task_create.recurrence.days_of_week)
+                if task_create.recurrence.days_of_week
+                else None
+            )
+            recurrence_days_of_month = (
+                json.dumps(task_create.recurrence.days_of_month)
+                if task_create.recurrence.days_of_month
+                else None
+            )
+
+        return (
+            task_id,
+            user_id,
+            task_create.title,
+            task_create.icon,
+            task_create.reminder_time.hour,
+            task_create.reminder_time.minute,
+            recurrence_interval,
+            recurrence_unit,
+            recurrence_days_of_week,
+            recurrence_days_of_month,
+            False,
+            operator_id,
+            operator_id,
+        )
+
+    @staticmethod
+    def _new_task(
+        task_id: str, task_create: CreateTaskRequest, operator_id: str, now: datetime
+    ) -> Task:
+        return Task(
+            id=task_id,
+            title=task_create.title,
+            icon=task_create.icon,
+            reminder_time=task_create.reminder_time,
+            recurrence=task_create.recurrence,
+            completed=False,
+            created_at=now,
+            created_by=operator_id,
+            updated_at=now,
+            updated_by=operator_id,
+            completed_at=None,
+            completed_by=None,
+        )
+
     @staticmethod
     def create_task(
         user_id: str, task_create: CreateTaskRequest, actual_operator_id: str = None
@@ -28,75 +98,50 @@ class TaskRepository:
             # Use actual_operator_id if provided, otherwise use user_id
             operator_id = actual_operator_id if actual_operator_id else user_id
 
-            # Prepare recurrence data
-            recurrence_interval = None
-            recurrence_unit = None
-            recurrence_days_of_week = None
-            recurrence_days_of_month = None
-
-            if task_create.recurrence:
-                recurrence_interval = task_create.recurrence.interval
-                recurrence_unit = task_create.recurrence.unit.value
-                recurrence_days_of_week = (
-                    json.dumps(task_create.recurrence.days_of_week)
-                    if task_create.recurrence.days_of_week
-                    else None
-                )
-                recurrence_days_of_month = (
-                    json.dumps(task_create.recurrence.days_of_month)
-                    if task_create.recurrence.days_of_month
-                    else None
-                )
-
-            # Insert task into database
-            insert_sql = """
-            INSERT INTO tasks (
-                id, user_id, title, icon, reminder_hour, reminder_minute,
-                recurrence_interval, recurrence_unit, 
-                recurrence_days_of_week, recurrence_days_of_month,
-                completed, created_by, updated_by
-            )
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """
-
             execute_update(
-                insert_sql,
-                (
-                    task_id,
-                    user_id,
-                    task_create.title,
-                    task_create.icon,
-                    task_create.reminder_time.hour,
-                    task_create.reminder_time.minute,
-                    recurrence_interval,
-                    recurrence_unit,
-                    recurrence_days_of_week,
-                    recurrence_days_of_month,
-                    False,
-                    operator_id,
-                    operator_id,
+                _INSERT_TASK_SQL,
+                TaskRepository._new_task_row(
+                    task_id, user_id, task_create, operator_id
                 ),
             )
 
             # Return task object
-            return Task(
-                id=task_id,
-                title=task_create.title,
-                icon=task_create.icon,
-                reminder_time=task_create.reminder_time,
-                recurrence=task_create.recurrence,
-                completed=False,
-                created_at=now,
-                created_by=operator_id,
-                updated_at=now,
-                updated_by=operator_id,
-                completed_at=None,
-                completed_by=None,
-            )
+            return TaskRepository._new_task(task_id, task_create, operator_id, now)
 
         except Exception as e:
             raise ValueError(f"Failed to create task: {str(e)}")
 
+    @staticmethod
+    def create_tasks(
+        user_id: str,
+        task_creates: List[CreateTaskRequest],
+        actual_operator_id: str = None,
+    ) -> List[Task]:
+        """Create several tasks in one batch insert"""
+        if not task_creates:
+            return []
+        try:
+            now = datetime.now()
+            operator_id = actual_operator_id if actual_operator_id else user_id
+            task_ids = [generate() for _ in task_creates]
+
+            execute_many(
+                _INSERT_TASK_SQL,
+                [
+                    TaskRepository._new_task_row(
+                        task_id, user_id, task_create, operator_id
+                    )
+                    for task_id, task_create in zip(task_ids, task_creates)
+                ],
+            )
+            return [
+                TaskRepository._new_task(task_id, task_create, operator_id, now)
+                for task_id, task_create in zip(task_ids, task_creates)
+            ]
+
+        except Exception as e:
+            raise ValueError(f"Failed to create tasks: {str(e)}")
+
     @staticmethod
     def get_tasks_for_user(user_id: str) -> List[Task]:
         """Get all non-deleted tasks for a user"""
@@ -141,6 +186,37 @@ class TaskRepository:
             print(f"Error getting task by id: {e}")
             return None
 
+    @staticmethod
+    def get_task_title(task_id: str) -> Optional[str]:
+        """Get the title of a non-deleted task by ID"""
+        try:
+            query = "SELECT title FROM tasks WHERE id = %s AND deleted = FALSE"
+            result = execute_query(query, (task_id,))
+            return result[0].get("title") if result else None
+        except Exception as e:
+            print(f"Error getting task title: {e}")
+            return None
+
+    @staticmethod
+    def get_task_title_and_user_name(
+        task_id: str, user_id: str
+    ) -> tuple[Optional[str], Optional[str]]:
+        """Get a task's title and a user's name together in a single round-trip"""
+        try:
+            # Scalar subqueries so a missing task still returns the user name
+            query = """
+            SELECT
+                (SELECT title FROM tasks WHERE id = %s AND deleted = FALSE) AS title,
+                (SELECT name FROM user_settings WHERE user_id = %s) AS name
+            """
+            result = execute_query(query, (task_id, user_id))
+        except Exception as e:
+            print(f"Error getting task title and user name: {e}")
+            return None, None
+
+        row = result[0] if result else {}
+        return row.get("title"), row.get("name")
+
     @staticmethod
     def update_task(
         user_id: str, task_id: str, updates: UpdateTaskFields
@@ -5,11 +5,14 @@ User repository - handles all database operations for users
 import json
 import logging
 from typing import Literal, Optional
-from uuid import UUID
 
 import mysql.connector
 
-from app.core.database import execute_query, execute_update
+from app.core.database import (
+    execute_prepared_query,
+    execute_query,
+    execute_update,
+)
 from app.schemas.user import Role, User, UserDB, UserDisplayMode, UserTextSize
 from app.services.security import get_password_hash
 
@@ -21,63 +24,38 @@ class UserRepository:
 
     @staticmethod
     def create_user(user_create) -> User:
-        """Create a new user. The id is provided by frontend and must be a valid UUID."""
+        """Create a new user. The id is provided by frontend and must be a valid UUID
+        (validated by the service layer)."""
         try:
-            # Validate id as UUID
-            try:
-                UUID(user_create.id)
-            except Exception:
-                raise ValueError("Invalid UUID format for user id")
-            # Check for existing user by id
-            existing = UserRepository.get_user(user_create.id, "id")
             # Hash password
             hashed_password = get_password_hash(user_create.password)
-            if not existing:
-                # Create new user
-                insert_sql = """
-                INSERT INTO users (id, email, hashed_password, role)
-                VALUES (%s, %s, %s, %s)
+            params = (
+                user_create.email,
+                hashed_password,
+                user_create.role,
+                user_create.id,
+            )
+            try:
+                # Upgrade an anonymous user (email IS NULL) with this id, if any
+                upgrade_sql = """
+                UPDATE users SET email=%s, hashed_password=%s, role=%s
+                WHERE id=%s AND email IS NULL
                 """
-                try:
-                    execute_update(
-                        insert_sql,
-                        (
-                            user_create.id,
-                            user_create.email,
-                            hashed_password,
-                            user_create.role,
-                        ),
-                    )
-                except mysql.connector.IntegrityError as e:
-                    if "Duplicate entry" in str(e) and "for key 'users.email'" in str(
-                        e
-                    ):
-                        raise ValueError("Email already registered")
-                    raise
-            else:
-                if existing.email:
-                    # Already registered
+                if not execute_update(upgrade_sql, params):
+                    # No anonymous user: create a new one. A plain INSERT (not an
+                    # upsert) so both unique keys still raise IntegrityError
+                    insert_sql = """
+                    INSERT INTO users (email, hashed_password, role, id)
+                    VALUES (%s, %s, %s, %s)
+                    """
+                    execute_update(insert_sql, params)
+            except mysql.connector.IntegrityError as e:
+                if "Duplicate entry" in str(e) and "for key 'users.email'" in str(e):
+                    raise ValueError("Email already registered")
+                if "Duplicate entry" in str(e) and "PRIMARY" in str(e):
+                    # The id belongs to a user who already has an email
                     raise ValueError("User id already registered")
-                # Upgrade anonymous user: set email, hashed_password, role
-                update_sql = """
-                UPDATE users SET email=%s, hashed_password=%s, role=%s WHERE id=%s
-                """
-                try:
-                    execute_update(
-                        update_sql,
-                        (
-                            user_create.email,
-                            hashed_password,
-                            user_create.role,
-                            user_create.id,
-                        ),
-                    )
-                except mysql.connector.IntegrityError as e:
-                    if "Duplicate entry" in str(e) and "for key 'users.email'" in str(
-                        e
-                    ):
-                        raise ValueError("Email already registered")
-                    raise
+                raise
             # Ensure user settings exist (insert if not exists)
             settings_sql = """
             INSERT IGNORE INTO user_settings (user_id, name, text_size, display_mode, reminder)
@@ -117,13 +95,9 @@ class UserRepository:
 
     @staticmethod
     def create_anonymous_user(user_id: str) -> User:
-        """Create a new anonymous user in database. The id is provided by frontend and must be a valid UUID."""
+        """Create a new anonymous user in database. The id is provided by frontend and must be a valid UUID
+        (validated by the service layer)."""
         try:
-            # Validate id as UUID
-            try:
-                UUID(user_id)
-            except Exception:
-                raise ValueError("Invalid UUID format for user id")
             # Check for duplicate id
             existing = UserRepository.get_user(user_id, "id")
             if existing:
@@ -192,13 +166,21 @@ class UserRepository:
     def get_user(value: str, by: Literal["id", "email"] = "id") -> Optional[UserDB]:
         """Get user from database by id or email only."""
         try:
+            # Select only the columns UserDB needs so email lookups are index-only
             if by == "id":
-                query = "SELECT * FROM users WHERE id = %s"
+                query = (
+                    "SELECT id, email, hashed_password, role FROM users "
+                    "WHERE id = %s"
+                )
             elif by == "email":
-                query = "SELECT * FROM users WHERE email = %s"
+                query = (
+                    "SELECT id, email, hashed_password, role FROM users "
+                    "WHERE email = %s"
+                )
             else:
                 return None
-            result = execute_query(query, (value,))
+            # Runs on every authenticated request, so reuse a prepared statement
+            result = execute_prepared_query(query, (value,))
             if result:
                 user_data = result[0]
                 role = None
@@ -221,8 +203,8 @@ class UserRepository:
 
     @staticmethod
     def userdb_to_user(userdb: UserDB) -> User:
-        """Convert UserDB to User."""
-        return User(id=userdb.id, email=userdb.email, role=userdb.role)
+        """Convert UserDB to User (fields are already validated, so skip validation)."""
+        return User.model_construct(id=userdb.id, email=userdb.email, role=userdb.role)
 
     @staticmethod
     def get_user_settings(user_id: str) -> Optional[dict]:
@@ -366,6 +348,15 @@ class UserRepository:
             print(f"Error updating user role: {e}")
             return False
 
+    @staticmethod
+    def delete_user(user_id: str) -> bool:
+        """Delete a user; settings, links and other owned rows cascade"""
+        try:
+            return execute_update("DELETE FROM users WHERE id = %s", (user_id,)) > 0
+        except Exception as e:
+            print(f"Error deleting user: {e}")
+            return False
+
     @staticmethod
     def get_group_user_ids(user_id: str, include_self: bool = False) -> list:
         """
@@ -424,18 +415,28 @@ class UserRepository:
             user_ids = UserRepository.get_group_user_ids(
                 user_id, include_self=include_self
             )
+            if not user_ids:
+                return []
+
+            # One query for every member instead of a user + settings lookup each
+            placeholders = ", ".join(["%s"] * len(user_ids))
+            query = f"""
+                SELECT u.id, u.email, u.role, s.name FROM users u
+                LEFT JOIN user_settings s ON s.user_id = u.id
+                WHERE u.id IN ({placeholders})
+            """
+            rows = {row["id"]: row for row in execute_query(query, tuple(user_ids))}
+
             users = []
-            for uid in user_ids:
-                user = UserRepository.get_user(uid, "id")
-                if user:
-                    settings = UserRepository.get_user_settings(uid)
-                    name = settings["name"] if settings and "name" in settings else None
+            for uid in user_ids:  # Keep the group order
+                row = rows.get(uid)
+                if row:
                     users.append(
                         {
-                            "id": user.id,
-                            "email": user.email,
-                            "name": name,
-                            "role": user.role,
+                            "id": row["id"],
+                            "email": row["email"],
+                            "name": row["name"],
+                            "role": Role(row["role"]) if row["role"] else None,
                         }
                     )
             return users
@@ -0,0 +1,23 @@
+from typing import List, Tuple
+
+from pydantic import BaseModel, Field
+
+from app.schemas.user import Role
+
+
+class BootstrapRequest(BaseModel):
+    users: List[Role] = Field(..., description="Role of each user to register")
+    links: List[Tuple[int, int]] = Field(
+        default_factory=list,
+        description="(inviter index, invitee index) pairs; the invitee becomes the caregiver",
+    )
+
+
+class BootstrapUser(BaseModel):
+    id: str
+    email: str
+    token: str
+
+
+class BootstrapResponse(BaseModel):
+    users: List[BootstrapUser]
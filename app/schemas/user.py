@@ -2,7 +2,7 @@ from datetime import datetime
 from enum import Enum
 from typing import List, Optional
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
 
 
 class Role(str, Enum):
@@ -11,6 +11,9 @@ class Role(str, Enum):
 
 
 class User(BaseModel):
+    # Frozen so cached instances can be shared safely between requests
+    model_config = ConfigDict(frozen=True)
+
     id: str  # Provided by frontend, must be valid UUID
     email: Optional[EmailStr] = None
     role: Role
@@ -160,6 +160,24 @@ class LinkService:
             print(f"Error getting caregiver links: {e}")
             return []
 
+    @staticmethod
+    def get_linked_carereceiver_id(caregiver_id: str) -> Optional[str]:
+        """Get the id of the carereceiver linked to a caregiver"""
+        # Not cached: this decides which tasks a caregiver may access, and an
+        # in-process cache would outlive an unlink made in another worker
+        try:
+            from app.core.database import execute_query
+
+            query = """
+            SELECT carereceiver_id FROM user_links WHERE caregiver_id = %s LIMIT 1
+            """
+            results = execute_query(query, (caregiver_id,))
+            return results[0]["carereceiver_id"] if results else None
+
+        except Exception as e:
+            print(f"Error getting linked carereceiver: {e}")
+            return None
+
     @staticmethod
     def get_carereceiver_links(carereceiver_id: str) -> List[dict]:
         """Get all caregivers linked to a carereceiver"""
@@ -1,12 +1,17 @@
 import asyncio
 import logging
 import os
-from typing import Optional
+from typing import Dict, List, Optional
 
 from app.api.notification import user_queues
 from app.repositories.notification import NotificationRepository
+from app.repositories.task import TaskRepository
 from app.repositories.user import UserRepository
-from app.schemas.notification import NotificationCategory, NotificationLevel
+from app.schemas.notification import (
+    NotificationCategory,
+    NotificationData,
+    NotificationLevel,
+)
 from app.services.reminder_utils import (
     should_send_safe_zone_notification,
     should_send_task_notification,
@@ -14,6 +19,14 @@ from app.services.reminder_utils import (
 
 logger = logging.getLogger(__name__)
 
+# notification_type -> (message template, payload action)
+TASK_NOTIFICATION_TEMPLATES = {
+    "create": ("{name} created a new task: {title}.", "TASK_CREATED"),
+    "update": ("{name} updated task: {title}.", "TASK_UPDATED"),
+    "complete": ("{name} marked '{title}' as done.", "TASK_COMPLETED"),
+    "delete": ("{name} deleted task: {title}.", "TASK_DELETED"),
+}
+
 
 class NotificationManager:
     @staticmethod
@@ -32,13 +45,21 @@ class NotificationManager:
             level=level,
         )
 
+        # Only read the row back when there is an sse connection to push it to
+        if notification_id and user_id in user_queues:
+            notification = NotificationRepository.get_notifications_by_id(
+                notification_id=notification_id
+            )
+            NotificationManager._push_notification(user_id, notification)
+
+    @staticmethod
+    def _push_notification(user_id: str, notification: NotificationData):
         # Send sse notification to user if user has active connection
         queue = user_queues.get(user_id)
-        notification = NotificationRepository.get_notifications_by_id(
-            notification_id=notification_id
-        )
+        if os.getenv("TESTING") == "true" or not queue or notification is None:
+            return
         notificationJson = notification.model_dump(mode="json")
-        if os.getenv("TESTING") != "true" and queue and notificationJson:
+        if notificationJson:
             try:
                 # Check if there's a running event loop
                 asyncio.get_running_loop()
@@ -58,15 +79,14 @@ class NotificationManager:
 
     @staticmethod
     def _get_task_title(task_id: str) -> str:
-        # Try to get task by id (search all users)
         # This assumes task_id is unique globally
-        query = "SELECT title FROM tasks WHERE id = %s AND deleted = FALSE"
-        from app.core.database import execute_query
+        return TaskRepository.get_task_title(task_id) or "Task"
 
-        result = execute_query(query, (task_id,))
-        if result and result[0].get("title"):
-            return result[0]["title"]
-        return "Task"
+    @staticmethod
+    def _get_name_and_title(user_id: str, task_id: str) -> tuple[str, str]:
+        """Get user name and task title together in a single round-trip"""
+        title, name = TaskRepository.get_task_title_and_user_name(task_id, user_id)
+        return name or "User", title or "Task"
 
     @staticmethod
     def notify_safezone_warning(user_id: str, monitor_user_id: str) -> Optional[str]:
@@ -87,20 +107,22 @@ class NotificationManager:
         )
 
     @staticmethod
-    def notify_task_updated(
-        user_id: str, executor_user_id: str, task_id: str
+    def _notify_task(
+        user_id: str, executor_user_id: str, task_id: str, notification_type: str
     ) -> Optional[str]:
-        # Check if user wants task change notifications
-        if not should_send_task_notification(user_id, "update"):
+        # Check if user wants this kind of task notification
+        if not should_send_task_notification(user_id, notification_type):
             return None
 
-        name = NotificationManager._get_user_name(executor_user_id)
-        task_title = NotificationManager._get_task_title(task_id)
-        message = f"{name} updated task: {task_title}."
+        template, action = TASK_NOTIFICATION_TEMPLATES[notification_type]
+        name, task_title = NotificationManager._get_name_and_title(
+            executor_user_id, task_id
+        )
+        message = template.format_map({"name": name, "title": task_title})
         payload = {
             "executor_user_id": executor_user_id,
             "task_id": task_id,
-            "action": "TASK_UPDATED",
+            "action": action,
         }
         NotificationManager._create_and_push_notification(
             user_id=user_id,
@@ -111,74 +133,112 @@ class NotificationManager:
         )
 
     @staticmethod
-    def notify_task_deleted(
+    def notify_task_group(
+        user_ids: List[str],
+        executor_user_id: str,
+        task_id: str,
+        notification_type: str,
+    ):
+        """
+        Notify every group member except the executor about a task event,
+        inserting all notifications in one batch.
+        """
+        NotificationManager.notify_task_group_bulk(
+            user_ids=user_ids,
+            executor_user_id=executor_user_id,
+            task_ids=[task_id],
+            notification_type=notification_type,
+        )
+
+    @staticmethod
+    def notify_task_group_bulk(
+        user_ids: List[str],
+        executor_user_id: str,
+        task_ids: List[str],
+        notification_type: str,
+        task_titles: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Same as notify_task_group for several tasks, still in one batch insert.
+        Titles already known to the caller can be passed in task_titles.
+        """
+        recipients = [
+            uid
+            for uid in user_ids
+            if uid != executor_user_id
+            and should_send_task_notification(uid, notification_type)
+        ]
+        if not recipients or not task_ids:
+            return
+
+        titles = dict(task_titles or {})
+        missing = [task_id for task_id in task_ids if not titles.get(task_id)]
+        if missing:
+            # The executor's name comes back with the first missing title
+            name, titles[missing[0]] = NotificationManager._get_name_and_title(
+                executor_user_id, missing[0]
+            )
+            for task_id in missing[1:]:
+                titles[task_id] = NotificationManager._get_task_title(task_id)
+        else:
+            name = NotificationManager._get_user_name(executor_user_id)
+
+        template, action = TASK_NOTIFICATION_TEMPLATES[notification_type]
+        items = []
+        for task_id in task_ids:
+            message = template.format_map({"name": name, "title": titles[task_id]})
+            payload = {
+                "executor_user_id": executor_user_id,
+                "task_id": task_id,
+                "action": action,
+            }
+            items.extend(
+                {
+                    "user_id": uid,
+                    "category": NotificationCategory.TASK,
+                    "message": message,
+                    "payload": payload,
+                    "level": NotificationLevel.GENERAL,
+                }
+                for uid in recipients
+            )
+
+        notifications = NotificationRepository.create_notifications_bulk(items)
+        for notification in notifications:
+            NotificationManager._push_notification(
+                notification.user_id, notification
+            )
+
+    @staticmethod
+    def notify_task_updated(
         user_id: str, executor_user_id: str, task_id: str
     ) -> Optional[str]:
-        # Check if user wants task change notifications
-        if not should_send_task_notification(user_id, "delete"):
-            return None
+        return NotificationManager._notify_task(
+            user_id, executor_user_id, task_id, "update"
+        )
 
-        name = NotificationManager._get_user_name(executor_user_id)
-        task_title = NotificationManager._get_task_title(task_id)
-        message = f"{name} deleted task: {task_title}."
-        payload = {
-            "executor_user_id": executor_user_id,
-            "task_id": task_id,
-            "action": "TASK_DELETED",
-        }
-        NotificationManager._create_and_push_notification(
-            user_id=user_id,
-            category=NotificationCategory.TASK,
-            message=message,
-            payload=payload,
-            level=NotificationLevel.GENERAL,
+    @staticmethod
+    def notify_task_deleted(
+        user_id: str, executor_user_id: str, task_id: str
+    ) -> Optional[str]:
+        return NotificationManager._notify_task(
+            user_id, executor_user_id, task_id, "delete"
         )
 
     @staticmethod
     def notify_task_created(
         user_id: str, executor_user_id: str, task_id: str
     ) -> Optional[str]:
-        # Check if user wants task notifications
-        if not should_send_task_notification(user_id, "create"):
-            return None
-
-        name = NotificationManager._get_user_name(executor_user_id)
-        task_title = NotificationManager._get_task_title(task_id)
-        message = f"{name} created a new task: {task_title}."
-        payload = {
-            "executor_user_id": executor_user_id,
-            "task_id": task_id,
-            "action": "TASK_CREATED",
-        }
-        NotificationManager._create_and_push_notification(
-            user_id=user_id,
-            category=NotificationCategory.TASK,
-            message=message,
-            payload=payload,
-            level=NotificationLevel.GENERAL,
+        return NotificationManager._notify_task(
+            user_id, executor_user_id, task_id, "create"
         )
 
     @staticmethod
     def notify_task_completed(
         user_id: str, executor_user_id: str, task_id: str
     ) -> Optional[str]:
-        # Check if user wants task completion notifications
-        if not should_send_task_notification(user_id, "complete"):
-            return None
-        name = NotificationManager._get_user_name(executor_user_id)
-        task_title = NotificationManager._get_task_title(task_id)
-        message = f"{name} marked '{task_title}' as done."
-        payload = {
-            "executor_user_id": executor_user_id,
-            "task_id": task_id,
-            "action": "TASK_COMPLETED",
-        }
-        NotificationManager._create_and_push_notification(
-            user_id=user_id,
-            category=NotificationCategory.TASK,
-            message=message,
-            payload=payload,
-            level=NotificationLevel.GENERAL,
+        return NotificationManager._notify_task(
+            user_id, executor_user_id, task_id, "complete"
         )
 
     @staticmethod
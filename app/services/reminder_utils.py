@@ -71,19 +71,19 @@ def get_user_reminder_settings(user_id: str) -> ReminderSettings:
         return ReminderSettings()
 
 
-def should_send_task_notification(user_id: str, notification_type: str) -> bool:
+def is_task_notification_enabled(
+    settings: ReminderSettings, notification_type: str
+) -> bool:
     """
-    Check if a task-related notification should be sent based on user's reminder settings.
+    Check an already-loaded ReminderSettings for a task-related notification type.
 
     Args:
-        user_id: The user ID to check settings for
+        settings: The user's reminder settings
         notification_type: Type of notification ('create', 'update', 'complete', 'delete')
 
     Returns:
         bool: True if notification should be sent, False otherwise
     """
-    settings = get_user_reminder_settings(user_id)
-
     if notification_type == "create":
         return settings.task_reminder
     elif notification_type == "update":
@@ -96,6 +96,23 @@ def should_send_task_notification(user_id: str, notification_type: str) -> bool:
         return True  # Default to sending for unknown types
 
 
+def should_send_task_notification(user_id: str, notification_type: str) -> bool:
+    """
+    Check if a task-related notification should be sent based on user's reminder settings.
+    Prefer loading settings once with get_user_reminder_settings and calling
+    is_task_notification_enabled when the settings are needed more than once.
+
+    Args:
+        user_id: The user ID to check settings for
+        notification_type: Type of notification ('create', 'update', 'complete', 'delete')
+
+    Returns:
+        bool: True if notification should be sent, False otherwise
+    """
+    settings = get_user_reminder_settings(user_id)
+    return is_task_notification_enabled(settings, notification_type)
+
+
 def should_send_safe_zone_notification(user_id: str) -> bool:
     """
     Check if safe zone exit notification should be sent based on user's reminder settings.
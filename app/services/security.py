@@ -1,25 +1,49 @@
-from datetime import datetime, timedelta, timezone
+import time
 
+import bcrypt
 import jwt
-from passlib.context import CryptContext
 
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# JWT settings bound once at import; call reload_jwt_config() after changing settings
+ACCESS_TOKEN_TTL_SECONDS = settings.access_token_expire_minutes * 60
+JWT_SECRET_KEY = settings.secret_key
+JWT_ALGORITHM = settings.algorithm
+JWT_ALGORITHMS = [settings.algorithm]
+
+
+def reload_jwt_config():
+    """Re-read JWT settings (e.g. after tests modify settings)"""
+    global ACCESS_TOKEN_TTL_SECONDS, JWT_SECRET_KEY, JWT_ALGORITHM, JWT_ALGORITHMS
+    ACCESS_TOKEN_TTL_SECONDS = settings.access_token_expire_minutes * 60
+    JWT_SECRET_KEY = settings.secret_key
+    JWT_ALGORITHM = settings.algorithm
+    JWT_ALGORITHMS = [settings.algorithm]
 
 
 def verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
+    if not hashed_password:
+        return False
+    try:
+        return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+    except ValueError:
+        # Malformed hash
+        return False
 
 
 def get_password_hash(password):
-    return pwd_context.hash(password)
+    # Call the bcrypt package directly instead of going through passlib
+    salt = bcrypt.gensalt(rounds=settings.bcrypt_rounds)
+    return bcrypt.hashpw(password.encode(), salt).decode()
 
 
 def create_access_token(data):
     to_encode = data.model_dump() if hasattr(data, "model_dump") else dict(data)
-    expire = datetime.now(timezone.utc) + timedelta(
-        minutes=settings.access_token_expire_minutes
-    )
-    to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
+    # PyJWT accepts a POSIX int for exp, so skip datetime arithmetic
+    to_encode["exp"] = int(time.time()) + ACCESS_TOKEN_TTL_SECONDS
+    return jwt.encode(to_encode, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
+
+
+def decode_access_token(token):
+    """Verify a JWT and return its payload (raises jwt.PyJWTError if invalid)"""
+    return jwt.decode(token, JWT_SECRET_KEY, algorithms=JWT_ALGORITHMS)
@@ -1,3 +1,5 @@
+from datetime import date, datetime, time
+from operator import attrgetter
 from typing import List, Optional
 
 from app.repositories.task import TaskRepository
@@ -7,31 +9,30 @@ from app.utils.user import get_actual_linked_carereceiver_id
 
 
 def taskdb_to_task(task: TaskDB) -> Task:
-    return Task(**task.model_dump(exclude={"deleted"}))
+    # TaskDB is already validated, so skip re-validation and the dict round-trip
+    return Task.model_construct(
+        **{k: v for k, v in task.__dict__.items() if k != "deleted"}
+    )
 
 
 def get_tasks_for_user(user_id: str, user_role: Role = None) -> List[Task]:
     """Get all tasks for a user from database, excluding overdue non-recurring tasks"""
-    from datetime import datetime
-
     # Get actual task owner ID
     actual_owner_id = get_actual_linked_carereceiver_id(user_id, user_role)
     if not actual_owner_id:
         return []  # Caregiver with no linked carereceiver has no tasks
 
     all_tasks = TaskRepository.get_tasks_for_user(actual_owner_id)
-    today = datetime.now().date()
-
-    filtered_tasks = []
-    for task in all_tasks:
-        # Always include recurring tasks
-        if task.recurrence is not None:
-            filtered_tasks.append(task)
-            continue
-        # Only include non-recurring tasks if created today
-        if hasattr(task, "created_at") and getattr(task, "created_at").date() == today:
-            filtered_tasks.append(task)
-    return filtered_tasks
+    # created_at comes back naive (DB session time), so compare against naive local midnight
+    today_start = datetime.combine(date.today(), time.min)
+    _created_at = attrgetter("created_at")
+
+    # Always include recurring tasks; only include non-recurring tasks if created today
+    return [
+        task
+        for task in all_tasks
+        if task.recurrence is not None or _created_at(task) >= today_start
+    ]
 
 
 def add_task(user_id: str, user_role: Role, task: TaskDB):
@@ -1,23 +1,18 @@
-from datetime import datetime, timedelta, timezone
+import asyncio
+import time
 from typing import Literal
 from uuid import UUID
 
-import jwt
-
-from app.core.config import settings
 from app.repositories.user import UserRepository
 from app.schemas.auth import RegisterRequest
 from app.schemas.user import User, UserDB
+from app.services import security
+from app.utils.ttl_cache import TTLCache
 
+MAX_TOKEN_LENGTH = 4096
 
-def create_access_token(data: dict, expires_delta: timedelta | None = None):
-    to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(minutes=15)
-    to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
+# Verified JWT payloads keyed by token; entries expire with the token itself
+_token_payload_cache = TTLCache(maxsize=4096, ttl=0)
 
 
 def create_user(user_create: RegisterRequest) -> User:
@@ -43,14 +38,34 @@ def create_anonymous_user(user_id: str) -> User:
     return UserRepository.create_anonymous_user(user_id)
 
 
+def _decode_token(token: str) -> dict | None:
+    """Decode and verify a JWT, reusing the payload for repeated tokens until it expires."""
+    payload = _token_payload_cache.get(token)
+    if payload is not None:
+        return payload
+    payload = security.decode_access_token(token)
+    exp = payload.get("exp")
+    if exp:
+        _token_payload_cache.set(token, payload, ttl=exp - time.time())
+    return payload
+
+
+async def get_user_from_token_async(token: str) -> User | None:
+    """Like get_user_from_token, run in a worker thread to keep the event loop free."""
+    return await asyncio.to_thread(get_user_from_token, token)
+
+
 def get_user_from_token(token: str) -> User | None:
+    # Cheaply reject obviously malformed tokens before any crypto work
+    if not token or len(token) > MAX_TOKEN_LENGTH or token.count(".") != 2:
+        return None
     try:
-        payload = jwt.decode(
-            token, settings.secret_key, algorithms=[settings.algorithm]
-        )
+        payload = _decode_token(token)
         user_id = payload.get("sub")
         if not user_id:
             return None
+        # Always a fresh read: role and email change (invitations, anonymous
+        # upgrades) and other workers would not see a cached copy invalidated
         userdb = UserRepository.get_user(user_id, "id")
         if userdb:
             return UserRepository.userdb_to_user(userdb)
@@ -3,20 +3,30 @@ import logging
 logger = logging.getLogger(__name__)
 
 
-def safe_block(block_name: str = "operation"):
-    """Context manager for safely executing a block of code"""
+class SafeBlock:
+    """Context manager that logs and suppresses any exception in its block"""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
 
-    class SafeBlock:
-        def __init__(self, name: str):
-            self.name = name
+    def __enter__(self):
+        return self
 
-        def __enter__(self):
-            return self
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is not None:
+            logger.warning("Safe block '%s' failed: %s", self.name, exc_val)
+            return True  # Suppress the exception
+        return False
 
-        def __exit__(self, exc_type, exc_val, exc_tb):
-            if exc_type is not None:
-                logger.warning(f"Safe block '{self.name}' failed: {exc_val}")
-                return True  # Suppress the exception
-            return False
 
+def safe_block(block_name: str = "operation"):
+    """Context manager for safely executing a block of code"""
     return SafeBlock(block_name)
+
+
+def run_safely(block_name: str, func, *args, **kwargs):
+    """Call func inside a safe block, e.g. as a background task"""
+    with safe_block(block_name):
+        func(*args, **kwargs)
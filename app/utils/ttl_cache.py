@@ -0,0 +1,41 @@
+import threading
+import time
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """Small thread-safe in-process cache with per-entry expiry"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: dict = {}  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        if entry[0] <= time.monotonic():
+            self.pop(key)
+            return default
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.maxsize:
+                # Evict the oldest entry
+                self._data.pop(next(iter(self._data)), None)
+            self._data[key] = (expires_at, value)
+
+    def pop(self, key: Hashable):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
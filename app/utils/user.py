@@ -12,10 +12,6 @@ def get_actual_linked_carereceiver_id(user_id: str, user_role):
     if user_role == Role.CARERECEIVER:
         return user_id
     elif user_role == Role.CAREGIVER:
-        linked_carereceivers = LinkService.get_caregiver_links(user_id)
-        if linked_carereceivers:
-            return linked_carereceivers[0]["id"]
-        else:
-            return None
+        return LinkService.get_linked_carereceiver_id(user_id)
     else:
         return None
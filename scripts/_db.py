@@ -0,0 +1,40 @@
+"""
+Shared MySQL connection pool for the CLI scripts
+Connections are server-level (no database selected); callers pick a
+database with `connection.database = ...` when needed.
+"""
+
+from contextlib import contextmanager
+
+from mysql.connector import pooling
+
+from app.core.config import settings
+
+_pool = None
+
+
+def get_pool() -> pooling.MySQLConnectionPool:
+    """Create the pool on first use"""
+    global _pool
+    if _pool is None:
+        _pool = pooling.MySQLConnectionPool(
+            pool_name="scripts",
+            pool_size=2,
+            host=settings.db_host,
+            port=settings.db_port,
+            user=settings.db_user,
+            password=settings.db_password,
+            charset=settings.db_charset,
+            use_pure=False,  # Prefer the C extension when it is installed
+        )
+    return _pool
+
+
+@contextmanager
+def server_connection():
+    """Borrow a pooled connection and return it to the pool afterwards"""
+    connection = get_pool().get_connection()
+    try:
+        yield connection
+    finally:
+        connection.close()  # Returns the connection to the pool
@@ -6,13 +6,12 @@ Clean up test database manually
 import os
 import sys
 
-import mysql.connector
 from mysql.connector import Error
 
 # Add the project root to Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.core.config import settings  # noqa: E402
+from scripts._db import server_connection  # noqa: E402
 from tests.test_config import TEST_DATABASE_NAME  # noqa: E402
 
 
@@ -21,19 +20,11 @@ def cleanup_test_database():
     print("🧹 Cleaning up test database...")
 
     try:
-        connection = mysql.connector.connect(
-            host=settings.db_host,
-            port=settings.db_port,
-            user=settings.db_user,
-            password=settings.db_password,
-        )
-
-        if connection.is_connected():
+        with server_connection() as connection:
             cursor = connection.cursor()
             cursor.execute(f"DROP DATABASE IF EXISTS {TEST_DATABASE_NAME}")
             connection.commit()
             cursor.close()
-            connection.close()
             print("✅ Test database removed")
             return True
 
@@ -8,13 +8,13 @@ import logging
 import os
 import sys
 
-import mysql.connector
 from mysql.connector import Error
 
 # Add the app directory to the Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
 from app.core.config import settings  # noqa: E402
+from scripts._db import server_connection  # noqa: E402
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -29,20 +29,15 @@ def get_database_name():
     return settings.db_name
 
 
-def create_database():
-    """Create the database if it doesn't exist"""
+def create_database(connection=None):
+    """Create the database if it doesn't exist (optionally on an existing server connection)"""
+    if connection is None:
+        with server_connection() as connection:
+            return create_database(connection)
+
     try:
         db_name = get_database_name()
 
-        # Connect to MySQL server (without specifying database)
-        connection = mysql.connector.connect(
-            host=settings.db_host,
-            port=settings.db_port,
-            user=settings.db_user,
-            password=settings.db_password,
-            charset=settings.db_charset,
-        )
-
         cursor = connection.cursor()
 
         # Create database if it doesn't exist
@@ -52,25 +47,27 @@ def create_database():
         logger.info(f"Database '{db_name}' created or already exists")
 
         cursor.close()
-        connection.close()
 
     except Error as e:
         logger.error(f"Error creating database: {e}")
         raise
 
 
-def create_tables(engine=None):
-    """Create initial tables"""
-    try:
-        from app.core.database import test_connection
-
-        # Test connection first
-        if not test_connection():
-            logger.error("Cannot connect to database")
+def create_tables(engine=None, connection=None, database=None):
+    """
+    Create initial tables.
+    An existing server connection can be passed in to avoid reconnecting;
+    tables are created in `database` (defaults to settings.db_name).
+    """
+    if connection is None:
+        try:
+            with server_connection() as connection:
+                return create_tables(engine, connection, database)
+        except Error as e:
+            logger.error(f"Cannot connect to database: {e}")
             return False
 
-        from app.core.database import execute_update
-
+    try:
         # Create users table based on new schema
         users_table_sql = """
         CREATE TABLE IF NOT EXISTS users (
@@ -79,7 +76,9 @@ def create_tables(engine=None):
             email VARCHAR(100) UNIQUE,
             hashed_password VARCHAR(255),
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+            -- Covering index for login lookups by email (InnoDB appends the id)
+            INDEX idx_users_email_cover (email, hashed_password, role)
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
         """
 
@@ -212,8 +211,8 @@ def create_tables(engine=None):
             timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
             FOREIGN KEY (target_user_id) REFERENCES users(id) ON DELETE CASCADE,
-            INDEX idx_logs_user_id (user_id),
-            INDEX idx_logs_target_user_id (target_user_id)
+            INDEX idx_logs_user_id (user_id, timestamp),
+            INDEX idx_logs_target_user_id (target_user_id, timestamp)
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
         """
 
@@ -229,24 +228,31 @@ def create_tables(engine=None):
             is_read BOOLEAN DEFAULT FALSE,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
-            INDEX idx_notifications_user_id (user_id),
+            INDEX idx_notifications_user_id (user_id, created_at),
+            INDEX idx_notifications_user_unread (user_id, is_read, created_at),
             INDEX idx_notifications_category (category),
             INDEX idx_notifications_level (level)
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
         """
 
-        # Create llm_logs table
+        # Create llm_logs table, partitioned by month
+        # (see scripts/rotate_log_partitions.py for adding new months)
         llm_logs_table_sql = """
         CREATE TABLE IF NOT EXISTS llm_logs (
-            id BIGINT AUTO_INCREMENT PRIMARY KEY,
+            id BIGINT AUTO_INCREMENT,
             user_id VARCHAR(255) NULL COMMENT 'User ID (optional)',
             conversation_id VARCHAR(255) NULL COMMENT 'Conversation ID (optional)',
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
             input_text TEXT NOT NULL COMMENT 'User input to LLM',
             output_text TEXT NULL COMMENT 'LLM response (NULL if failed)',
+            PRIMARY KEY (id, created_at),
             INDEX idx_user_id (user_id),
             INDEX idx_conversation_id (conversation_id)
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+        PARTITION BY RANGE (UNIX_TIMESTAMP(created_at)) (
+            PARTITION p_init VALUES LESS THAN (UNIX_TIMESTAMP('2025-01-01 00:00:00')),
+            PARTITION p_max VALUES LESS THAN MAXVALUE
+        )
         """
 
         # Create assistant_pending_tasks table
@@ -278,45 +284,36 @@ def create_tables(engine=None):
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
         """
 
-        # Execute table creation
-        execute_update(users_table_sql)
-        logger.info("Users table created successfully")
-
-        execute_update(user_settings_table_sql)
-        logger.info("User settings table created successfully")
-
-        execute_update(safe_zones_table_sql)
-        logger.info("Safe zones table created successfully")
-
-        execute_update(user_locations_table_sql)
-        logger.info("User locations table created successfully")
-
-        execute_update(shared_notes_table_sql)
-        logger.info("Shared notes table created successfully")
-
-        execute_update(user_links_table_sql)
-        logger.info("User links table created successfully")
-
-        execute_update(user_invitations_table_sql)
-        logger.info("User invitations table created successfully")
-
-        execute_update(tasks_table_sql)
-        logger.info("Tasks table created successfully")
-
-        execute_update(activity_logs_table_sql)
-        logger.info("Activity logs table created successfully")
-
-        execute_update(notifications_table_sql)
-        logger.info("Notifications table created successfully")
-
-        execute_update(llm_logs_table_sql)
-        logger.info("LLM logs table created successfully")
-
-        execute_update(assistant_pending_tasks_table_sql)
-        logger.info("Assistant pending tasks table created successfully")
+        # Execute table creation in a single multi-statement round-trip
+        # (order matters because of foreign keys)
+        ddl_statements = [
+            ("Users", users_table_sql),
+            ("User settings", user_settings_table_sql),
+            ("Safe zones", safe_zones_table_sql),
+            ("User locations", user_locations_table_sql),
+            ("Shared notes", shared_notes_table_sql),
+            ("User links", user_links_table_sql),
+            ("User invitations", user_invitations_table_sql),
+            ("Tasks", tasks_table_sql),
+            ("Activity logs", activity_logs_table_sql),
+            ("Notifications", notifications_table_sql),
+            ("LLM logs", llm_logs_table_sql),
+            ("Assistant pending tasks", assistant_pending_tasks_table_sql),
+            ("Assistant conversations", assistant_conversations_table_sql),
+        ]
+        ddl_script = ";\n".join(sql.strip() for _, sql in ddl_statements)
+
+        connection.database = database or settings.db_name
+        cursor = connection.cursor()
+        cursor.execute(ddl_script)
+        # Drain the result of every statement so errors surface here
+        while cursor.nextset():
+            pass
+        connection.commit()
+        cursor.close()
 
-        execute_update(assistant_conversations_table_sql)
-        logger.info("Assistant conversations table created successfully")
+        for name, _ in ddl_statements:
+            logger.info(f"{name} table created successfully")
 
         return True
 
@@ -330,15 +327,16 @@ def main():
     logger.info("Starting database initialization...")
 
     try:
-        # Step 1: Create database
-        create_database()
-
-        # Step 2: Create tables
-        if create_tables():
-            logger.info("Tables created successfully")
-        else:
-            logger.error("Failed to create tables")
-            return False
+        with server_connection() as connection:
+            # Step 1: Create database
+            create_database(connection)
+
+            # Step 2: Create tables
+            if create_tables(connection=connection):
+                logger.info("Tables created successfully")
+            else:
+                logger.error("Failed to create tables")
+                return False
 
         logger.info("Database initialization completed successfully!")
         return True
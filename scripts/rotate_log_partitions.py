@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Add monthly partitions to the llm_logs table
+Splits the catch-all p_max partition so that every month up to and
+including next month has its own partition. Safe to run repeatedly
+(e.g. from a monthly cron job).
+"""
+
+import logging
+import os
+import sys
+from datetime import date
+
+from mysql.connector import Error
+
+# Add the project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import settings  # noqa: E402
+from scripts._db import server_connection  # noqa: E402
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+PARTITIONED_TABLES = ["llm_logs"]
+
+# Upper bound of the p_init partition created by init_db
+FIRST_MONTH = date(2025, 1, 1)
+
+
+def _next_month(day: date) -> date:
+    return date(day.year + day.month // 12, day.month % 12 + 1, 1)
+
+
+def _existing_partitions(cursor, database: str, table: str) -> set:
+    cursor.execute(
+        """
+        SELECT partition_name FROM information_schema.partitions
+        WHERE table_schema = %s AND table_name = %s
+        """,
+        (database, table),
+    )
+    return {row[0] for row in cursor.fetchall()}
+
+
+def rotate_partitions(connection, database: str, until: date) -> int:
+    """Create missing monthly partitions up to `until`, returns how many were added"""
+    cursor = connection.cursor()
+    added = 0
+    for table in PARTITIONED_TABLES:
+        existing = _existing_partitions(cursor, database, table)
+        if "p_max" not in existing:
+            # Tables created before partitioning was added have no partitions
+            logger.error(
+                f"{table} is not partitioned, apply the one-time partitioning "
+                f"migration from the README (Initialize the Database) first"
+            )
+            continue
+
+        new_partitions = []
+        month = FIRST_MONTH
+        while month <= until:
+            # Partition p_YYYYMM holds rows created during that month
+            name = f"p_{month:%Y%m}"
+            month = _next_month(month)
+            if name not in existing:
+                new_partitions.append(
+                    f"PARTITION {name} VALUES LESS THAN "
+                    f"(UNIX_TIMESTAMP('{month:%Y-%m-%d} 00:00:00'))"
+                )
+
+        if not new_partitions:
+            continue
+
+        cursor.execute(
+            f"ALTER TABLE {database}.{table} REORGANIZE PARTITION p_max INTO ("
+            + ", ".join(new_partitions)
+            + ", PARTITION p_max VALUES LESS THAN MAXVALUE)"
+        )
+        added += len(new_partitions)
+        logger.info(f"Added {len(new_partitions)} partitions to {table}")
+    cursor.close()
+    return added
+
+
+def main():
+    """Main rotation function"""
+    try:
+        with server_connection() as connection:
+            rotate_partitions(
+                connection, settings.db_name, _next_month(date.today())
+            )
+        logger.info("Log partitions are up to date")
+    except Error as e:
+        logger.error(f"Error rotating log partitions: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,12 +7,11 @@ import os
 import subprocess
 import sys
 
-import mysql.connector
-
 # Add the project root to Python path
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__) + "/../"))
 
-from app.core.config import settings  # noqa: E402
+from scripts._db import server_connection  # noqa: E402
+from scripts.init_db import create_tables  # noqa: E402
 from tests.test_config import TEST_DATABASE_NAME  # noqa: E402
 
 
@@ -21,21 +20,20 @@ def setup_db():
     print("🔧 Setting up test database...")
 
     try:
-        connection = mysql.connector.connect(
-            host=settings.db_host,
-            port=settings.db_port,
-            user=settings.db_user,
-            password=settings.db_password,
-        )
-
-        cursor = connection.cursor()
-        cursor.execute(f"DROP DATABASE IF EXISTS {TEST_DATABASE_NAME}")
-        cursor.execute(f"CREATE DATABASE {TEST_DATABASE_NAME}")
-        cursor.close()
-        connection.close()
-
-        # Initialize tables
-        subprocess.run(["python3", "scripts/init_db.py"], check=True)
+        with server_connection() as connection:
+            cursor = connection.cursor()
+            cursor.execute(
+                f"DROP DATABASE IF EXISTS {TEST_DATABASE_NAME}; "
+                f"CREATE DATABASE {TEST_DATABASE_NAME}"
+            )
+            while cursor.nextset():
+                pass
+            cursor.close()
+
+            # Initialize tables in-process, reusing the same connection
+            created = create_tables(connection=connection, database=TEST_DATABASE_NAME)
+        if not created:
+            raise RuntimeError("Failed to create tables")
         print("✅ Test database ready")
         return True
 
@@ -44,7 +42,7 @@ def setup_db():
         return False
 
 
-def run_pytest():
+def run_pytest(parallel=False):
     """Run pytest with consistent options"""
     # Set environment variables for testing
     env = os.environ.copy()
@@ -61,7 +59,10 @@ def run_pytest():
             "--tb=short",
             "--disable-warnings",
             "--color=yes",
-        ],
+        ]
+        # Tests create their own users, so even one file's tests can be spread
+        # over workers; each worker gets its own database (see conftest)
+        + (["-n", "auto", "--dist=load"] if parallel else []),
         env=env,
     )
 
@@ -71,18 +72,11 @@ def cleanup_db():
     print("🧹 Cleaning up test database...")
 
     try:
-        connection = mysql.connector.connect(
-            host=settings.db_host,
-            port=settings.db_port,
-            user=settings.db_user,
-            password=settings.db_password,
-        )
-
-        cursor = connection.cursor()
-        cursor.execute(f"DROP DATABASE IF EXISTS {TEST_DATABASE_NAME}")
-        connection.commit()
-        cursor.close()
-        connection.close()
+        with server_connection() as connection:
+            cursor = connection.cursor()
+            cursor.execute(f"DROP DATABASE IF EXISTS {TEST_DATABASE_NAME}")
+            connection.commit()
+            cursor.close()
         print("✅ Test database removed")
 
     except Exception as e:
@@ -92,6 +86,7 @@ def cleanup_db():
 def main():
     """Main test runner"""
     keep_db = "--keep-db" in sys.argv
+    parallel = "--parallel" in sys.argv
 
     print("🚀 Starting test run...")
 
@@ -101,7 +96,7 @@ def main():
 
     # Run tests
     print("🧪 Running tests...")
-    result = run_pytest()
+    result = run_pytest(parallel=parallel)
 
     # Cleanup (unless keeping database)
     if not keep_db:
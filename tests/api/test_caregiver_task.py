@@ -1,113 +1,92 @@
-import uuid
-
+import pytest
 from fastapi import status
-from nanoid import generate
 
+from app.repositories.task import TaskRepository
+from app.repositories.user import UserRepository
+from app.schemas.task import CreateTaskRequest
 from app.schemas.user import Role
+from app.utils.user import get_actual_linked_carereceiver_id
+from tests.conftest import auth_headers, get_task_lists
 
+# Notifications are covered by test_notification.py
+pytestmark = pytest.mark.usefixtures("no_task_notifications")
 
-class TestCaregiverTaskAPI:
-    """Test group for caregiver operating carereceiver tasks."""
 
-    def _register_and_login(self, client, user_id=None, role=Role.CARERECEIVER):
-        email = f"caregiver_test_{generate(size=8)}@example.com"
-        password = "test123456"
-        if user_id is None:
-            user_id = str(uuid.uuid4())
-        user_data = {
-            "email": email,
-            "password": password,
-            "id": user_id,
-            "name": "Test User",
-            "role": role,
-        }
-        reg = client.post("/auth/register", json=user_data)
-        assert reg.status_code == status.HTTP_201_CREATED
-        login = client.post("/auth/login", json={"email": email, "password": password})
-        assert login.status_code == status.HTTP_200_OK
-        token = login.json()["access_token"]
-        return email, token, user_id
+@pytest.fixture
+def linked_pair(client):
+    """Register two carereceivers, link them, and return their info."""
+    # One request instead of register x2 + invitation generate/accept.
+    # The "caregiver" user is the inviter; the invitee is promoted to CAREGIVER.
+    resp = client.post(
+        "/testing/bootstrap",
+        json={"users": [Role.CARERECEIVER, Role.CARERECEIVER], "links": [[0, 1]]},
+    )
+    assert resp.status_code == status.HTTP_200_OK
+    caregiver, carereceiver = resp.json()["users"]
+    return {"caregiver": caregiver, "carereceiver": carereceiver}
 
-    def _auth_headers(self, token):
-        return {"Authorization": f"Bearer {token}"}
 
-    def _create_task(self, client, token, title="Take medicine", icon="💊"):
-        req = {
+class TestCaregiverTaskAPI:
+    """Test group for caregiver operating carereceiver tasks."""
+
+    def _task_request(self, title, icon):
+        return {
             "title": title,
             "icon": icon,
             "reminder_time": {"hour": 8, "minute": 0},
             "recurrence": {"interval": 1, "unit": "DAY"},
         }
-        resp = client.post("/tasks", json=req, headers=self._auth_headers(token))
-        assert resp.status_code == status.HTTP_200_OK
-        return resp.json()
 
-    def _link_users(self, client, caregiver_token, carereceiver_token):
-        """Link caregiver and carereceiver"""
-        # Generate invitation from caregiver
-        resp = client.post(
-            "/user/invitations/generate", headers=self._auth_headers(caregiver_token)
-        )
-        assert resp.status_code == status.HTTP_200_OK
-        code = resp.json()["invitation_code"]
-
-        # Accept invitation from carereceiver
-        resp = client.post(
-            f"/user/invitations/{code}/accept",
-            headers=self._auth_headers(carereceiver_token),
-        )
+    async def _create_task_api(
+        self, async_client, token, title="Take medicine", icon="💊"
+    ):
+        """Create a task through POST /tasks (for tests about task creation)."""
+        req = self._task_request(title, icon)
+        resp = await async_client.post("/tasks", json=req, headers=auth_headers(token))
         assert resp.status_code == status.HTTP_200_OK
+        return resp.json()
 
-    def test_caregiver_creates_task_for_carereceiver(self, client):
+    def _create_task_direct(self, user_id, title="Take medicine", icon="💊"):
+        """Seed a task through the repository, skipping HTTP, and return its id."""
+        user = UserRepository.get_user(user_id, "id")
+        # Same owner resolution as POST /tasks
+        owner_id = get_actual_linked_carereceiver_id(user.id, user.role)
+        req = CreateTaskRequest(**self._task_request(title, icon))
+        return TaskRepository.create_task(owner_id, req, user.id).id
+
+    @pytest.mark.anyio
+    async def test_caregiver_creates_task_for_carereceiver(
+        self, async_client, linked_pair, assert_max_queries
+    ):
         """Caregiver should be able to create tasks for linked carereceiver"""
-        # Register caregiver(be carereceiver before linking) and carereceiver
-        caregiver_email, caregiver_token, caregiver_id = self._register_and_login(
-            client, role=Role.CARERECEIVER
-        )
-        carereceiver_email, carereceiver_token, carereceiver_id = (
-            self._register_and_login(client, role=Role.CARERECEIVER)
-        )
-
-        # Link them
-        self._link_users(client, caregiver_token, carereceiver_token)
+        caregiver_token = linked_pair["caregiver"]["token"]
+        carereceiver_token = linked_pair["carereceiver"]["token"]
 
         # Caregiver creates task
-        task_data = self._create_task(client, caregiver_token, "Take medicine", "💊")
+        task_data = await self._create_task_api(
+            async_client, caregiver_token, "Take medicine", "💊"
+        )
         task_id = task_data["task"]["id"]
 
-        # Verify task was created for carereceiver (not caregiver)
-        # Get tasks as carereceiver
-        resp = client.get("/tasks", headers=self._auth_headers(carereceiver_token))
-        assert resp.status_code == status.HTTP_200_OK
-        carereceiver_tasks = resp.json()["tasks"]
-        assert len(carereceiver_tasks) == 1
-        assert carereceiver_tasks[0]["id"] == task_id
-        assert carereceiver_tasks[0]["title"] == "Take medicine"
-
-        # Get tasks as caregiver (should see carereceiver's tasks)
-        resp = client.get("/tasks", headers=self._auth_headers(caregiver_token))
-        assert resp.status_code == status.HTTP_200_OK
-        caregiver_tasks = resp.json()["tasks"]
-        assert len(caregiver_tasks) == 1
-        assert caregiver_tasks[0]["id"] == task_id
-        assert caregiver_tasks[0]["title"] == "Take medicine"
-
-    def test_caregiver_updates_task_for_carereceiver(self, client):
+        # Verify task was created for carereceiver (not caregiver), and that the
+        # caregiver sees the carereceiver's tasks
+        # Auth and task list for the carereceiver, plus the linked carereceiver
+        # lookup for the caregiver
+        with assert_max_queries(5):
+            carereceiver_tasks, caregiver_tasks = await get_task_lists(
+                async_client, carereceiver_token, caregiver_token
+            )
+        for tasks in (carereceiver_tasks, caregiver_tasks):
+            assert len(tasks) == 1
+            assert tasks[0]["id"] == task_id
+            assert tasks[0]["title"] == "Take medicine"
+
+    def test_caregiver_updates_task_for_carereceiver(self, client, linked_pair):
         """Caregiver should be able to update tasks for linked carereceiver"""
-        # Register caregiver(be carereceiver before linking) and carereceiver
-        caregiver_email, caregiver_token, caregiver_id = self._register_and_login(
-            client, role=Role.CARERECEIVER
-        )
-        carereceiver_email, carereceiver_token, carereceiver_id = (
-            self._register_and_login(client, role=Role.CARERECEIVER)
-        )
-
-        # Link them
-        self._link_users(client, caregiver_token, carereceiver_token)
+        caregiver_token = linked_pair["caregiver"]["token"]
 
         # Carereceiver creates task
-        task_data = self._create_task(client, carereceiver_token, "Take medicine", "💊")
-        task_id = task_data["task"]["id"]
+        task_id = self._create_task_direct(linked_pair["carereceiver"]["id"])
 
         # Caregiver updates the task
         update_req = {
@@ -117,70 +96,56 @@ class TestCaregiverTaskAPI:
         resp = client.put(
             f"/tasks/{task_id}",
             json=update_req,
-            headers=self._auth_headers(caregiver_token),
+            headers=auth_headers(caregiver_token),
         )
         assert resp.status_code == status.HTTP_200_OK
 
         # Verify task was updated
-        resp = client.get(
-            f"/tasks/{task_id}", headers=self._auth_headers(caregiver_token)
-        )
+        resp = client.get(f"/tasks/{task_id}", headers=auth_headers(caregiver_token))
         assert resp.status_code == status.HTTP_200_OK
         updated_task = resp.json()["task"]
         assert updated_task["title"] == "Take medicine updated"
         assert updated_task["reminder_time"]["hour"] == 9
         assert updated_task["reminder_time"]["minute"] == 30
 
-    def test_caregiver_deletes_task_for_carereceiver(self, client):
+    @pytest.mark.anyio
+    async def test_caregiver_deletes_task_for_carereceiver(
+        self, async_client, linked_pair
+    ):
         """Caregiver should be able to delete tasks for linked carereceiver"""
-        # Register caregiver(be carereceiver before linking) and carereceiver
-        caregiver_email, caregiver_token, caregiver_id = self._register_and_login(
-            client, role=Role.CARERECEIVER
-        )
-        carereceiver_email, carereceiver_token, carereceiver_id = (
-            self._register_and_login(client, role=Role.CARERECEIVER)
-        )
-
-        # Link them
-        self._link_users(client, caregiver_token, carereceiver_token)
+        caregiver_token = linked_pair["caregiver"]["token"]
+        carereceiver_token = linked_pair["carereceiver"]["token"]
 
         # Carereceiver creates task
-        task_data = self._create_task(client, carereceiver_token, "Take medicine", "💊")
-        task_id = task_data["task"]["id"]
+        task_id = self._create_task_direct(linked_pair["carereceiver"]["id"])
 
         # Verify task exists for both users
-        resp = client.get("/tasks", headers=self._auth_headers(caregiver_token))
-        assert resp.status_code == status.HTTP_200_OK
-        assert len(resp.json()["tasks"]) == 1
-
-        resp = client.get("/tasks", headers=self._auth_headers(carereceiver_token))
-        assert resp.status_code == status.HTTP_200_OK
-        assert len(resp.json()["tasks"]) == 1
+        task_lists = await get_task_lists(
+            async_client, caregiver_token, carereceiver_token
+        )
+        assert [len(tasks) for tasks in task_lists] == [1, 1]
 
         # Caregiver deletes the task
-        resp = client.delete(
-            f"/tasks/{task_id}", headers=self._auth_headers(caregiver_token)
+        resp = await async_client.delete(
+            f"/tasks/{task_id}", headers=auth_headers(caregiver_token)
         )
         assert resp.status_code == status.HTTP_200_OK
 
         # Verify task was deleted for both users
-        resp = client.get("/tasks", headers=self._auth_headers(caregiver_token))
-        assert resp.status_code == status.HTTP_200_OK
-        assert len(resp.json()["tasks"]) == 0
-
-        resp = client.get("/tasks", headers=self._auth_headers(carereceiver_token))
-        assert resp.status_code == status.HTTP_200_OK
-        assert len(resp.json()["tasks"]) == 0
+        task_lists = await get_task_lists(
+            async_client, caregiver_token, carereceiver_token
+        )
+        assert [len(tasks) for tasks in task_lists] == [0, 0]
 
-    def test_caregiver_without_linked_carereceiver_gets_no_tasks(self, client):
+    def test_caregiver_without_linked_carereceiver_gets_no_tasks(
+        self, client, register_user
+    ):
         """Caregiver without linked carereceiver should get no tasks"""
         # Register caregiver only
-        caregiver_email, caregiver_token, caregiver_id = self._register_and_login(
-            client, role=Role.CAREGIVER
-        )
+        caregiver_email, caregiver_token, caregiver_id = register_user(Role.CAREGIVER)
 
         # Try to get tasks
-        resp = client.get("/tasks", headers=self._auth_headers(caregiver_token))
+        resp = client.get("/tasks", headers=auth_headers(caregiver_token))
         assert resp.status_code == status.HTTP_200_OK
         tasks = resp.json()["tasks"]
         assert len(tasks) == 0
@@ -191,34 +156,29 @@ class TestCaregiverTaskAPI:
             "icon": "💊",
             "reminder_time": {"hour": 8, "minute": 0},
         }
-        resp = client.post(
-            "/tasks", json=req, headers=self._auth_headers(caregiver_token)
-        )
+        resp = client.post("/tasks", json=req, headers=auth_headers(caregiver_token))
         assert resp.status_code == status.HTTP_400_BAD_REQUEST
         assert "No linked carereceiver found for caregiver" in resp.json()["detail"]
 
-    def test_caregiver_cannot_access_unlinked_carereceiver_tasks(self, client):
+    def test_caregiver_cannot_access_unlinked_carereceiver_tasks(
+        self, client, register_user
+    ):
         """Caregiver should not be able to access unlinked carereceiver's tasks"""
         # Register caregiver and carereceiver
-        caregiver_email, caregiver_token, caregiver_id = self._register_and_login(
-            client, role=Role.CAREGIVER
-        )
-        carereceiver_email, carereceiver_token, carereceiver_id = (
-            self._register_and_login(client, role=Role.CARERECEIVER)
+        caregiver_email, caregiver_token, caregiver_id = register_user(Role.CAREGIVER)
+        carereceiver_email, carereceiver_token, carereceiver_id = register_user(
+            Role.CARERECEIVER
         )
 
         # Carereceiver creates task (without linking)
-        task_data = self._create_task(client, carereceiver_token, "Take medicine", "�")
-        task_id = task_data["task"]["id"]
+        task_id = self._create_task_direct(carereceiver_id)
 
         # Caregiver should not see the task
-        resp = client.get("/tasks", headers=self._auth_headers(caregiver_token))
+        resp = client.get("/tasks", headers=auth_headers(caregiver_token))
         assert resp.status_code == status.HTTP_200_OK
         tasks = resp.json()["tasks"]
         assert len(tasks) == 0
 
         # Caregiver should not be able to access the task
-        resp = client.get(
-            f"/tasks/{task_id}", headers=self._auth_headers(caregiver_token)
-        )
+        resp = client.get(f"/tasks/{task_id}", headers=auth_headers(caregiver_token))
         assert resp.status_code == status.HTTP_404_NOT_FOUND
@@ -1,62 +1,101 @@
+import asyncio
+
+import pytest
+
 from app.schemas.user import Role
 from tests.conftest import auth_headers
 
+# Run against the ASGI app directly (see async_client in conftest)
+pytestmark = pytest.mark.anyio
 
-def create_invitation(client, token):
-    resp = client.post("/user/invitations/generate", headers=auth_headers(token))
+
+async def create_invitation(client, token):
+    resp = await client.post("/user/invitations/generate", headers=auth_headers(token))
     assert resp.status_code == 200
     return resp.json()["invitation_code"]
 
 
-def get_invitation_info(client, code, token):
-    return client.get(f"/user/invitations/{code}", headers=auth_headers(token))
+async def get_invitation_info(client, code, token):
+    return await client.get(f"/user/invitations/{code}", headers=auth_headers(token))
 
 
-def accept_invitation(client, code, token):
-    return client.post(f"/user/invitations/{code}/accept", headers=auth_headers(token))
+async def accept_invitation(client, code, token):
+    return await client.post(
+        f"/user/invitations/{code}/accept", headers=auth_headers(token)
+    )
 
 
-def cancel_invitation(client, code, token):
-    return client.delete(f"/user/invitations/{code}", headers=auth_headers(token))
+async def cancel_invitation(client, code, token):
+    return await client.delete(f"/user/invitations/{code}", headers=auth_headers(token))
 
 
 class TestInvitationAPI:
-    def test_generate_and_get_invitation(self, client, register_user):
+    async def test_generate_and_get_invitation(self, async_client, async_register_user):
         """Should generate and fetch invitation info successfully."""
-        _, token, _ = register_user(Role.CAREGIVER)
-        code = create_invitation(client, token)
-        resp = get_invitation_info(client, code, token)
+        _, token, _ = await async_register_user(Role.CAREGIVER)
+        code = await create_invitation(async_client, token)
+        resp = await get_invitation_info(async_client, code, token)
         assert resp.status_code == 200
         data = resp.json()
         assert "inviter_name" in data
         assert "inviter_role" in data
         assert "expires_at" in data
 
-    def test_get_invitation_not_found(self, client, register_user):
-        _, token, _ = register_user(Role.CAREGIVER)
-        resp = get_invitation_info(client, "NONEXIST", token)
+    async def test_get_invitation_not_found(self, async_client, async_register_user):
+        _, token, _ = await async_register_user(Role.CAREGIVER)
+        resp = await get_invitation_info(async_client, "NONEXIST", token)
         assert resp.status_code == 404
 
-    def test_accept_invitation_not_found(self, client, register_user):
-        _, token, _ = register_user(Role.CAREGIVER)
-        resp = accept_invitation(client, "NONEXIST", token)
+    async def test_accept_invitation_not_found(self, async_client, async_register_user):
+        _, token, _ = await async_register_user(Role.CAREGIVER)
+        resp = await accept_invitation(async_client, "NONEXIST", token)
         assert resp.status_code == 404
 
-    def test_cancel_invitation_by_inviter(self, client, register_user):
-        _, token, _ = register_user(Role.CAREGIVER)
-        code = create_invitation(client, token)
-        resp = cancel_invitation(client, code, token)
+    @pytest.mark.parametrize(
+        "inviter_role, invitee_role, expected_status",
+        [
+            (Role.CARERECEIVER, Role.CARERECEIVER, 200),
+            (Role.CAREGIVER, Role.CARERECEIVER, 400),
+            (Role.CARERECEIVER, Role.CAREGIVER, 400),
+            (Role.CAREGIVER, Role.CAREGIVER, 400),
+        ],
+    )
+    async def test_accept_invitation_role_check(
+        self,
+        async_client,
+        async_register_user,
+        inviter_role,
+        invitee_role,
+        expected_status,
+    ):
+        """Only a carereceiver can accept another carereceiver's invitation."""
+        (_, inviter_token, _), (_, invitee_token, _) = await asyncio.gather(
+            async_register_user(inviter_role), async_register_user(invitee_role)
+        )
+        code = await create_invitation(async_client, inviter_token)
+        resp = await accept_invitation(async_client, code, invitee_token)
+        assert resp.status_code == expected_status
+
+    async def test_cancel_invitation_by_inviter(
+        self, async_client, async_register_user
+    ):
+        _, token, _ = await async_register_user(Role.CAREGIVER)
+        code = await create_invitation(async_client, token)
+        resp = await cancel_invitation(async_client, code, token)
         assert resp.status_code == 200
         assert "Invitation cancelled successfully" in resp.json()["data"]["message"]
 
-    def test_cancel_invitation_by_non_inviter(self, client, register_user):
-        _, token, _ = register_user(Role.CAREGIVER)
-        code = create_invitation(client, token)
-        _, other_token, _ = register_user(Role.CAREGIVER)
-        resp = cancel_invitation(client, code, other_token)
+    async def test_cancel_invitation_by_non_inviter(
+        self, async_client, async_register_user
+    ):
+        (_, token, _), (_, other_token, _) = await asyncio.gather(
+            async_register_user(Role.CAREGIVER), async_register_user(Role.CAREGIVER)
+        )
+        code = await create_invitation(async_client, token)
+        resp = await cancel_invitation(async_client, code, other_token)
         assert resp.status_code == 403
 
-    def test_cancel_invitation_not_found(self, client, register_user):
-        _, token, _ = register_user(Role.CAREGIVER)
-        resp = cancel_invitation(client, "NONEXIST", token)
+    async def test_cancel_invitation_not_found(self, async_client, async_register_user):
+        _, token, _ = await async_register_user(Role.CAREGIVER)
+        resp = await cancel_invitation(async_client, "NONEXIST", token)
         assert resp.status_code == 404
@@ -1,3 +1,5 @@
+import pytest
+
 from app.schemas.user import Role
 from tests.conftest import auth_headers
 
@@ -42,3 +44,30 @@ class TestLinkAPI:
         # Try to remove a link with a non-existent user
         resp = remove_link(client, caregiver_token, "noone@notfound.com")
         assert resp.status_code == 404
+
+
+class TestBootstrapLinks:
+    def test_bootstrap_links_users(self, client):
+        """Should link bootstrapped users the same way an accepted invitation does."""
+        resp = client.post(
+            "/testing/bootstrap",
+            json={"users": [Role.CARERECEIVER, Role.CARERECEIVER], "links": [[0, 1]]},
+        )
+        assert resp.status_code == 200
+        carereceiver, caregiver = resp.json()["users"]
+        me = client.get("/user/me", headers=auth_headers(caregiver["token"]))
+        assert me.status_code == 200
+        assert me.json()["role"] == Role.CAREGIVER
+        linked = me.json()["settings"]["linked"]
+        assert [link["email"] for link in linked] == [carereceiver["email"]]
+
+    @pytest.mark.parametrize(
+        "link", [[0, -1], [0, 2], [0, 0]], ids=["negative", "too_large", "self"]
+    )
+    def test_bootstrap_invalid_link(self, client, link):
+        """Should reject links to unknown users or to the same user."""
+        resp = client.post(
+            "/testing/bootstrap",
+            json={"users": [Role.CARERECEIVER, Role.CARERECEIVER], "links": [link]},
+        )
+        assert resp.status_code == 400
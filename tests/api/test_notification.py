@@ -1,206 +1,156 @@
-from tests.conftest import auth_headers
-
-
-def setup_linked_users(client, register_user):
-    """Helper: register two carereceiver, B accept A's invitation, B become caregiver"""
-    a_email, a_token, a_id = register_user("CARERECEIVER")
-    b_email, b_token, b_id = register_user("CARERECEIVER")
-    # A generate invitation code
-    invite_resp = client.post(
-        "/user/invitations/generate", headers=auth_headers(a_token)
-    )
-    invitation_code = invite_resp.json()["invitation_code"]
-    # B accept, B become caregiver
-    accept_resp = client.post(
-        f"/user/invitations/{invitation_code}/accept",
-        headers=auth_headers(b_token),
-    )
-    assert accept_resp.status_code == 200
-    return {
-        "carereceiver": {"token": a_token, "email": a_email, "id": a_id},
-        "caregiver": {"token": b_token, "email": b_email, "id": b_id},
-    }
-
-
-def test_notification_after_create_task(client, register_user):
-    """Test notification is sent to group members when creating a task."""
-    users = setup_linked_users(client, register_user)
-    caregiver_token = users["caregiver"]["token"]
-    carereceiver_token = users["carereceiver"]["token"]
-
-    # Create task as caregiver
-    task_payload = {
-        "title": "Test Notification Task",
-        "icon": "check",
-        "reminder_time": {"hour": 9, "minute": 0},
-        "recurrence": None,
-    }
-    create_task_resp = client.post(
-        "/tasks", json=task_payload, headers=auth_headers(caregiver_token)
-    )
-    assert create_task_resp.status_code == 200
-
-    # Check that carereceiver receives notification
-    response = client.get("/notifications", headers=auth_headers(carereceiver_token))
-    assert response.status_code == 200
-    response_data = response.json()
+import pytest
+
+from app.core.database import execute_query
+from app.repositories.notification import NotificationRepository
+from app.schemas.notification import NotificationCategory
+from app.schemas.user import Role
+from tests.conftest import auth_headers, request_ok
+
+# Run against the ASGI app directly (see async_client in conftest)
+pytestmark = pytest.mark.anyio
+
+# Task created by the caregiver to trigger notifications
+TASK_PAYLOAD = {
+    "title": "Test Task",
+    "icon": "check",
+    "reminder_time": {"hour": 9, "minute": 0},
+    "recurrence": None,
+}
+
+
+@pytest.fixture
+async def linked_users(async_client):
+    """Register two carereceivers, B accepts A's invitation and becomes caregiver."""
+    # One request instead of register x2 + invitation generate/accept. Tests change
+    # their users' settings and notifications, so each test gets a fresh pair.
+    bootstrap_data = await request_ok(
+        async_client,
+        "POST",
+        "/testing/bootstrap",
+        json={"users": [Role.CARERECEIVER, Role.CARERECEIVER], "links": [[0, 1]]},
+    )
+    carereceiver, caregiver = bootstrap_data["users"]
+    # Built once here instead of at every request
+    for user in (carereceiver, caregiver):
+        user["headers"] = auth_headers(user["token"])
+    return {"carereceiver": carereceiver, "caregiver": caregiver}
+
+
+@pytest.fixture
+def seeded_notifications(linked_users):
+    """Insert notifications for the carereceiver in one batch and return their ids."""
+    created = NotificationRepository.create_notifications_bulk(
+        [
+            {
+                "user_id": linked_users["carereceiver"]["id"],
+                "category": NotificationCategory.SYSTEM,
+                "message": f"Seeded notification {i + 1}",
+            }
+            for i in range(10)
+        ]
+    )
+    assert len(created) == 10
+    return [n.id for n in created]
+
+
+async def fetch_notifications(client, headers):
+    """Get a user's notification list, checking the response shape."""
+    response_data = await request_ok(client, "GET", "/notifications", headers=headers)
     assert "notifications" in response_data
-    notif_list = response_data["notifications"]
-    assert any("created a new task" in n["message"] for n in notif_list)
-
-
-def test_notification_after_update_task(client, register_user):
-    """Test notification is sent to group members when updating a task."""
-    users = setup_linked_users(client, register_user)
-    caregiver_token = users["caregiver"]["token"]
-    carereceiver_token = users["carereceiver"]["token"]
+    return response_data["notifications"]
 
-    # Create task as caregiver
-    task_payload = {
-        "title": "Test Task",
-        "icon": "check",
-        "reminder_time": {"hour": 9, "minute": 0},
-        "recurrence": None,
-    }
-    create_resp = client.post(
-        "/tasks", json=task_payload, headers=auth_headers(caregiver_token)
-    )
-    assert create_resp.status_code == 200
-    task_id = create_resp.json()["task"]["id"]
-
-    # Update task as caregiver
-    update_payload = {"title": "Updated Task Title"}
-    update_resp = client.put(
-        f"/tasks/{task_id}", json=update_payload, headers=auth_headers(caregiver_token)
-    )
-    assert update_resp.status_code == 200
 
-    # Check that carereceiver receives update notification
-    response = client.get("/notifications", headers=auth_headers(carereceiver_token))
-    assert response.status_code == 200
-    response_data = response.json()
-    assert "notifications" in response_data
-    notif_list = response_data["notifications"]
-    assert any("updated task" in n["message"] for n in notif_list)
+def notification_actions(notif_list):
+    """The payload actions in a notification list, e.g. TASK_CREATED."""
+    return {(n["payload"] or {}).get("action") for n in notif_list}
 
 
-def test_notification_after_complete_task(client, register_user):
-    """Test notification is sent to group members when completing a task."""
-    users = setup_linked_users(client, register_user)
-    caregiver_token = users["caregiver"]["token"]
-    carereceiver_token = users["carereceiver"]["token"]
+async def test_task_notifications_lifecycle(async_client, linked_users):
+    """Test notification is sent to group members for each step of a task's life."""
+    caregiver_headers = linked_users["caregiver"]["headers"]
+    carereceiver_headers = linked_users["carereceiver"]["headers"]
 
     # Create task as caregiver
-    task_payload = {
-        "title": "Test Task",
-        "icon": "check",
-        "reminder_time": {"hour": 9, "minute": 0},
-        "recurrence": None,
-    }
-    create_resp = client.post(
-        "/tasks", json=task_payload, headers=auth_headers(caregiver_token)
-    )
-    assert create_resp.status_code == 200
-    task_id = create_resp.json()["task"]["id"]
-
-    # Complete task as caregiver
-    complete_payload = {"completed": True}
-    complete_resp = client.put(
+    create_data = await request_ok(
+        async_client, "POST", "/tasks", json=TASK_PAYLOAD, headers=caregiver_headers
+    )
+    task_id = create_data["task"]["id"]
+
+    # Update, complete and delete the same task as caregiver
+    await request_ok(
+        async_client,
+        "PUT",
+        f"/tasks/{task_id}",
+        json={"title": "Updated Task Title"},
+        headers=caregiver_headers,
+    )
+    await request_ok(
+        async_client,
+        "PUT",
         f"/tasks/{task_id}/status",
-        json=complete_payload,
-        headers=auth_headers(caregiver_token),
-    )
-    assert complete_resp.status_code == 200
-
-    # Check that carereceiver receives completion notification
-    response = client.get("/notifications", headers=auth_headers(carereceiver_token))
-    assert response.status_code == 200
-    response_data = response.json()
-    assert "notifications" in response_data
-    notif_list = response_data["notifications"]
-    assert any("marked" in n["message"] and "done" in n["message"] for n in notif_list)
-
-
-def test_notification_after_delete_task(client, register_user):
-    """Test notification is sent to group members when deleting a task."""
-    users = setup_linked_users(client, register_user)
-    caregiver_token = users["caregiver"]["token"]
-    carereceiver_token = users["carereceiver"]["token"]
-
-    # Create task as caregiver
-    task_payload = {
-        "title": "Test Task",
-        "icon": "check",
-        "reminder_time": {"hour": 9, "minute": 0},
-        "recurrence": None,
-    }
-    create_resp = client.post(
-        "/tasks", json=task_payload, headers=auth_headers(caregiver_token)
+        json={"completed": True},
+        headers=caregiver_headers,
     )
-    assert create_resp.status_code == 200
-    task_id = create_resp.json()["task"]["id"]
-
-    # Delete task as caregiver
-    delete_resp = client.delete(
-        f"/tasks/{task_id}", headers=auth_headers(caregiver_token)
+    await request_ok(
+        async_client, "DELETE", f"/tasks/{task_id}", headers=caregiver_headers
     )
-    assert delete_resp.status_code == 200
 
-    # Check that carereceiver receives deletion notification
-    response = client.get("/notifications", headers=auth_headers(carereceiver_token))
-    assert response.status_code == 200
-    response_data = response.json()
-    assert "notifications" in response_data
-    notif_list = response_data["notifications"]
-    assert any("deleted task" in n["message"] for n in notif_list)
+    # Check that carereceiver received a notification for every step, and the
+    # caregiver none for their own actions
+    notif_list = await fetch_notifications(async_client, carereceiver_headers)
+    actions = notification_actions(notif_list)
+    own_notif_list = await fetch_notifications(async_client, caregiver_headers)
+    own_actions = notification_actions(own_notif_list)
+    for action in ["TASK_CREATED", "TASK_UPDATED", "TASK_COMPLETED", "TASK_DELETED"]:
+        assert action in actions
+        assert action not in own_actions
 
 
-def test_notification_after_accept_invitation(client, register_user):
+async def test_notification_after_accept_invitation(async_client, async_register_user):
     """Test notification is sent when accepting an invitation."""
     # Test invitation notification, the process is the same
-    cr_email, cr_token, cr_id = register_user("CARERECEIVER")
-    cg_email, cg_token, cg_id = register_user("CARERECEIVER")
+    cr_email, cr_token, cr_id = await async_register_user("CARERECEIVER")
+    cg_email, cg_token, cg_id = await async_register_user("CARERECEIVER")
 
     # Generate invitation as caregiver
-    invite_resp = client.post(
-        "/user/invitations/generate", headers=auth_headers(cr_token)
+    invite_data = await request_ok(
+        async_client,
+        "POST",
+        "/user/invitations/generate",
+        headers=auth_headers(cr_token),
     )
-    assert invite_resp.status_code == 200
-    invitation_code = invite_resp.json()["invitation_code"]
+    invitation_code = invite_data["invitation_code"]
 
     # Accept invitation as carereceiver
-    accept_resp = client.post(
+    await request_ok(
+        async_client,
+        "POST",
         f"/user/invitations/{invitation_code}/accept",
         headers=auth_headers(cg_token),
     )
-    assert accept_resp.status_code == 200
 
     # Check that caregiver receives notification
-    response = client.get("/notifications", headers=auth_headers(cr_token))
-    assert response.status_code == 200
-    response_data = response.json()
-    assert "notifications" in response_data
-    notif_list = response_data["notifications"]
-    assert any("linked with you" in n["message"] for n in notif_list)
+    notif_list = await fetch_notifications(async_client, auth_headers(cr_token))
+    assert "LINKED_ACCOUNT" in notification_actions(notif_list)
 
 
-def test_notification_after_safe_zone_violation(client, register_user):
-    """Test notification is sent when carereceiver leaves safe zone."""
-    users = setup_linked_users(client, register_user)
-    caregiver_token = users["caregiver"]["token"]
-    carereceiver_token = users["carereceiver"]["token"]
-    carereceiver_email = users["carereceiver"]["email"]
+async def test_safe_zone_boundary(async_client, linked_users):
+    """Test notification is sent only once carereceiver leaves the safe zone."""
+    caregiver_headers = linked_users["caregiver"]["headers"]
+    carereceiver_headers = linked_users["carereceiver"]["headers"]
+    carereceiver_email = linked_users["carereceiver"]["email"]
 
     # Allow location sharing
     updated_settings = {
         "allow_share_location": True,
     }
-    update_settings_resp = client.put(
+    await request_ok(
+        async_client,
+        "PUT",
         "/user/settings",
         json=updated_settings,
-        headers=auth_headers(carereceiver_token),
+        headers=carereceiver_headers,
     )
-    assert update_settings_resp.status_code == 200
 
     # Create safe zone for carereceiver
     safe_zone_data = {
@@ -212,128 +162,50 @@ def test_notification_after_safe_zone_violation(client, register_user):
         },
         "radius": 1000,  # 1km radius
     }
-
-    safe_zone_resp = client.post(
+    await request_ok(
+        async_client,
+        "POST",
         f"/safe-zone/{carereceiver_email}",
         json=safe_zone_data,
-        headers=auth_headers(caregiver_token),
-    )
-    assert safe_zone_resp.status_code == 200
-
-    # Update carereceiver location to outside safe zone (far away)
-    location_payload = {
-        "latitude": 51.5000,  # Far from safe zone center
-        "longitude": -2.6000,
-    }
-    location_resp = client.post(
-        "/user/location",
-        json=location_payload,
-        headers=auth_headers(carereceiver_token),
-    )
-    assert location_resp.status_code == 200
-
-    # Check that caregiver receives safe zone warning notification
-    response = client.get("/notifications", headers=auth_headers(caregiver_token))
-    assert response.status_code == 200
-    response_data = response.json()
-    assert "notifications" in response_data
-    notif_list = response_data["notifications"]
-    assert any("has left the safe zone" in n["message"] for n in notif_list)
-
-
-def test_no_notification_when_within_safe_zone(client, register_user):
-    """Test no notification is sent when carereceiver is within safe zone."""
-    users = setup_linked_users(client, register_user)
-    caregiver_token = users["caregiver"]["token"]
-    carereceiver_token = users["carereceiver"]["token"]
-    carereceiver_email = users["carereceiver"]["email"]
-
-    # Allow location sharing
-    updated_settings = {
-        "allow_share_location": True,
-    }
-    update_settings_resp = client.put(
-        "/user/settings",
-        json=updated_settings,
-        headers=auth_headers(carereceiver_token),
+        headers=caregiver_headers,
     )
-    assert update_settings_resp.status_code == 200
 
-    # Create safe zone for carereceiver
-    safe_zone_data = {
-        "location": {
-            "name": "Home",
-            "address": "123 Main St, Bristol",
-            "latitude": 51.4529183,
-            "longitude": -2.5994918,
-        },
-        "radius": 1000,  # 1km radius
-    }
-    safe_zone_resp = client.post(
-        f"/safe-zone/{carereceiver_email}",
-        json=safe_zone_data,
-        headers=auth_headers(caregiver_token),
-    )
-    assert safe_zone_resp.status_code == 200
+    async def left_safe_zone_notified(location_payload):
+        await request_ok(
+            async_client,
+            "POST",
+            "/user/location",
+            json=location_payload,
+            headers=carereceiver_headers,
+        )
+        notif_list = await fetch_notifications(async_client, caregiver_headers)
+        return "SAFEZONE_LEFT" in notification_actions(notif_list)
 
-    # Update carereceiver location to within safe zone
-    location_payload = {
-        "latitude": 51.4529183,  # Same as safe zone center
-        "longitude": -2.5994918,
-    }
-    location_resp = client.post(
-        "/user/location",
-        json=location_payload,
-        headers=auth_headers(carereceiver_token),
+    # Within safe zone (same as safe zone center): no warning
+    assert not await left_safe_zone_notified(
+        {"latitude": 51.4529183, "longitude": -2.5994918}
     )
-    assert location_resp.status_code == 200
-
-    # Check that caregiver does not receive safe zone warning notification
-    response = client.get("/notifications", headers=auth_headers(caregiver_token))
-    assert response.status_code == 200
-    response_data = response.json()
-    assert "notifications" in response_data
-    notif_list = response_data["notifications"]
-    assert not any("has left the safe zone" in n["message"] for n in notif_list)
+    # Moving outside (far from safe zone center): caregiver is warned
+    assert await left_safe_zone_notified({"latitude": 51.5000, "longitude": -2.6000})
 
 
-def test_mark_notifications_as_read(client, register_user):
+async def test_mark_notifications_as_read(
+    async_client, linked_users, seeded_notifications, assert_max_queries
+):
     """Test marking notifications as read."""
-    users = setup_linked_users(client, register_user)
-    caregiver_token = users["caregiver"]["token"]
-    carereceiver_token = users["carereceiver"]["token"]
-
-    # Create a task to generate notification
-    task_payload = {
-        "title": "Test Task",
-        "icon": "check",
-        "reminder_time": {"hour": 9, "minute": 0},
-        "recurrence": None,
-    }
-    create_resp = client.post(
-        "/tasks", json=task_payload, headers=auth_headers(caregiver_token)
-    )
-    assert create_resp.status_code == 200
-
-    # Get notifications for carereceiver
-    response = client.get("/notifications", headers=auth_headers(carereceiver_token))
-    assert response.status_code == 200
-    response_data = response.json()
-    assert "notifications" in response_data
-    notif_list = response_data["notifications"]
-    assert len(notif_list) > 0
-
-    # Get notification IDs to mark as read
-    notification_ids = [notif["id"] for notif in notif_list]
-
-    # Mark notifications as read
-    mark_read_resp = client.put(
-        "/notifications/mark-read",
-        json=notification_ids,
-        headers=auth_headers(carereceiver_token),
-    )
-    assert mark_read_resp.status_code == 200
-    mark_read_data = mark_read_resp.json()
+    carereceiver_headers = linked_users["carereceiver"]["headers"]
+    notification_ids = seeded_notifications
+
+    # Mark notifications as read: auth, one ownership check and one UPDATE,
+    # however many ids are sent
+    with assert_max_queries(3):
+        mark_read_data = await request_ok(
+            async_client,
+            "PUT",
+            "/notifications/mark-read",
+            json=notification_ids,
+            headers=carereceiver_headers,
+        )
     assert mark_read_data["success"] is True
     assert "data" in mark_read_data
     data = mark_read_data["data"]
@@ -341,88 +213,55 @@ def test_mark_notifications_as_read(client, register_user):
     assert data["total_count"] == len(notification_ids)
 
     # Verify notifications are marked as read
-    response = client.get("/notifications", headers=auth_headers(carereceiver_token))
-    assert response.status_code == 200
-    response_data = response.json()
-    assert "notifications" in response_data
-    notif_list = response_data["notifications"]
-    for notif in notif_list:
-        if notif["id"] in notification_ids:
-            assert notif["is_read"] is True
-
-
-def test_mark_notifications_as_read_empty_list(client, register_user):
-    """Test marking notifications as read with empty list."""
-    users = setup_linked_users(client, register_user)
-    carereceiver_token = users["carereceiver"]["token"]
+    notif_list = await fetch_notifications(async_client, carereceiver_headers)
+    assert {n["id"] for n in notif_list if n["is_read"]} >= set(notification_ids)
 
-    # Try to mark empty list as read
-    mark_read_resp = client.put(
-        "/notifications/mark-read",
-        json=[],
-        headers=auth_headers(carereceiver_token),
-    )
-    assert mark_read_resp.status_code == 400
-    assert "empty" in mark_read_resp.json()["detail"]
-
-
-def test_mark_notifications_as_read_invalid_id(client, register_user):
-    """Test marking notifications as read with invalid notification ID."""
-    users = setup_linked_users(client, register_user)
-    carereceiver_token = users["carereceiver"]["token"]
-
-    # Try to mark non-existent notification as read
-    mark_read_resp = client.put(
-        "/notifications/mark-read",
-        json=["invalid-notification-id"],
-        headers=auth_headers(carereceiver_token),
-    )
-    assert mark_read_resp.status_code == 404
-    assert "not found" in mark_read_resp.json()["detail"]
-
-
-def test_mark_notifications_as_read_unauthorized(client, register_user):
-    """Test marking notifications as read for notifications that don't belong to user."""
-    users = setup_linked_users(client, register_user)
-    caregiver_token = users["caregiver"]["token"]
-    carereceiver_token = users["carereceiver"]["token"]
-
-    # Create a task to generate notification for carereceiver
-    task_payload = {
-        "title": "Test Task",
-        "icon": "check",
-        "reminder_time": {"hour": 9, "minute": 0},
-        "recurrence": None,
-    }
-    create_resp = client.post(
-        "/tasks", json=task_payload, headers=auth_headers(caregiver_token)
-    )
-    assert create_resp.status_code == 200
-
-    # Get notifications for carereceiver
-    response = client.get("/notifications", headers=auth_headers(carereceiver_token))
-    assert response.status_code == 200
-    response_data = response.json()
-    assert "notifications" in response_data
-    notif_list = response_data["notifications"]
-    assert len(notif_list) > 0
-
-    # Try to mark carereceiver's notification as read using caregiver token
-    notification_ids = [notif["id"] for notif in notif_list]
-    mark_read_resp = client.put(
+    # Marking already-read notifications still counts them
+    mark_again_data = await request_ok(
+        async_client,
+        "PUT",
         "/notifications/mark-read",
         json=notification_ids,
-        headers=auth_headers(caregiver_token),
+        headers=carereceiver_headers,
+    )
+    assert mark_again_data["data"]["marked_count"] == len(notification_ids)
+
+
+@pytest.mark.parametrize(
+    "sender, payload, expected_status, detail",
+    [
+        ("carereceiver", [], 400, "empty"),
+        ("carereceiver", ["invalid-notification-id"], 404, "not found"),
+        # None: the carereceiver's seeded notifications, sent by the caregiver
+        ("caregiver", None, 403, "does not belong to current user"),
+    ],
+    ids=["empty_list", "invalid_id", "unauthorized"],
+)
+async def test_mark_notifications_as_read_errors(
+    async_client,
+    linked_users,
+    seeded_notifications,
+    sender,
+    payload,
+    expected_status,
+    detail,
+):
+    """Test marking notifications as read fails for invalid notification ID lists."""
+    mark_read_data = await request_ok(
+        async_client,
+        "PUT",
+        "/notifications/mark-read",
+        expect=expected_status,
+        json=seeded_notifications if payload is None else payload,
+        headers=linked_users[sender]["headers"],
     )
-    assert mark_read_resp.status_code == 403
-    assert "does not belong to current user" in mark_read_resp.json()["detail"]
+    assert detail in mark_read_data["detail"]
 
 
-def test_notification_disabled_by_reminder_settings(client, register_user):
+async def test_notification_disabled_by_reminder_settings(async_client, linked_users):
     """Test that notifications are not sent when disabled in reminder settings."""
-    users = setup_linked_users(client, register_user)
-    caregiver_token = users["caregiver"]["token"]
-    carereceiver_token = users["carereceiver"]["token"]
+    caregiver_headers = linked_users["caregiver"]["headers"]
+    carereceiver_headers = linked_users["carereceiver"]["headers"]
 
     # Disable task notifications for carereceiver
     reminder_settings = {
@@ -433,40 +272,31 @@ def test_notification_disabled_by_reminder_settings(client, register_user):
         "overdue_reminder": {"enabled": False, "delay_minutes": 30, "repeat": False},
     }
 
-    settings_resp = client.put(
+    await request_ok(
+        async_client,
+        "PUT",
         "/user/settings",
         json={"reminder": reminder_settings},
-        headers=auth_headers(carereceiver_token),
+        headers=carereceiver_headers,
     )
-    assert settings_resp.status_code == 200
 
     # Create task as caregiver
-    task_payload = {
-        "title": "Test Task",
-        "icon": "check",
-        "reminder_time": {"hour": 9, "minute": 0},
-        "recurrence": None,
-    }
-    create_resp = client.post(
-        "/tasks", json=task_payload, headers=auth_headers(caregiver_token)
+    await request_ok(
+        async_client, "POST", "/tasks", json=TASK_PAYLOAD, headers=caregiver_headers
     )
-    assert create_resp.status_code == 200
 
     # Check that carereceiver does NOT receive notification (disabled)
-    response = client.get("/notifications", headers=auth_headers(carereceiver_token))
-    assert response.status_code == 200
-    response_data = response.json()
-    assert "notifications" in response_data
-    notif_list = response_data["notifications"]
-    assert not any("created a new task" in n["message"] for n in notif_list)
+    notif_list = await fetch_notifications(async_client, carereceiver_headers)
+    assert "TASK_CREATED" not in notification_actions(notif_list)
 
 
-def test_safe_zone_notification_disabled_by_reminder_settings(client, register_user):
+async def test_safe_zone_notification_disabled_by_reminder_settings(
+    async_client, linked_users
+):
     """Test that safe zone notifications are not sent when disabled in reminder settings."""
-    users = setup_linked_users(client, register_user)
-    caregiver_token = users["caregiver"]["token"]
-    carereceiver_token = users["carereceiver"]["token"]
-    carereceiver_email = users["carereceiver"]["email"]
+    caregiver_headers = linked_users["caregiver"]["headers"]
+    carereceiver_headers = linked_users["carereceiver"]["headers"]
+    carereceiver_email = linked_users["carereceiver"]["email"]
 
     # Disable safe zone notifications for caregiver
     reminder_settings = {
@@ -477,23 +307,25 @@ def test_safe_zone_notification_disabled_by_reminder_settings(client, register_u
         "overdue_reminder": {"enabled": True, "delay_minutes": 30, "repeat": True},
     }
 
-    settings_resp = client.put(
+    await request_ok(
+        async_client,
+        "PUT",
         "/user/settings",
         json={"reminder": reminder_settings},
-        headers=auth_headers(caregiver_token),
+        headers=caregiver_headers,
     )
-    assert settings_resp.status_code == 200
 
     # Allow location sharing
     updated_settings = {
         "allow_share_location": True,
     }
-    update_settings_resp = client.put(
+    await request_ok(
+        async_client,
+        "PUT",
         "/user/settings",
         json=updated_settings,
-        headers=auth_headers(carereceiver_token),
+        headers=carereceiver_headers,
     )
-    assert update_settings_resp.status_code == 200
 
     # Create safe zone for carereceiver
     safe_zone_data = {
@@ -505,57 +337,50 @@ def test_safe_zone_notification_disabled_by_reminder_settings(client, register_u
         },
         "radius": 1000,  # 1km radius
     }
-    safe_zone_resp = client.post(
+    await request_ok(
+        async_client,
+        "POST",
         f"/safe-zone/{carereceiver_email}",
         json=safe_zone_data,
-        headers=auth_headers(caregiver_token),
+        headers=caregiver_headers,
     )
-    assert safe_zone_resp.status_code == 200
 
     # Update carereceiver location to outside safe zone
     location_payload = {
         "latitude": 51.5000,  # Far from safe zone center
         "longitude": -2.6000,
     }
-    location_resp = client.post(
+    await request_ok(
+        async_client,
+        "POST",
         "/user/location",
         json=location_payload,
-        headers=auth_headers(carereceiver_token),
+        headers=carereceiver_headers,
     )
-    assert location_resp.status_code == 200
 
     # Check that caregiver does NOT receive safe zone notification (disabled)
-    response = client.get("/notifications", headers=auth_headers(caregiver_token))
-    assert response.status_code == 200
-    response_data = response.json()
-    assert "notifications" in response_data
-    notif_list = response_data["notifications"]
-    assert not any("has left the safe zone" in n["message"] for n in notif_list)
+    notif_list = await fetch_notifications(async_client, caregiver_headers)
+    assert "SAFEZONE_LEFT" not in notification_actions(notif_list)
 
 
-def test_get_notifications_with_total_count(client, register_user):
+async def test_get_notifications_with_total_count(async_client, linked_users):
     """Test that notifications API returns total count in response."""
-    users = setup_linked_users(client, register_user)
-    caregiver_token = users["caregiver"]["token"]
-    carereceiver_token = users["carereceiver"]["token"]
-
-    # Create multiple tasks to generate notifications
-    for i in range(3):
-        task_payload = {
-            "title": f"Test Task {i+1}",
-            "icon": "check",
-            "reminder_time": {"hour": 9, "minute": 0},
-            "recurrence": None,
-        }
-        create_resp = client.post(
-            "/tasks", json=task_payload, headers=auth_headers(caregiver_token)
-        )
-        assert create_resp.status_code == 200
+    caregiver_headers = linked_users["caregiver"]["headers"]
+    carereceiver_headers = linked_users["carereceiver"]["headers"]
+
+    # Create multiple tasks in one request to generate notifications
+    await request_ok(
+        async_client,
+        "POST",
+        "/tasks/bulk",
+        json=[{**TASK_PAYLOAD, "title": f"Test Task {i+1}"} for i in range(3)],
+        headers=caregiver_headers,
+    )
 
     # Get notifications for carereceiver
-    response = client.get("/notifications", headers=auth_headers(carereceiver_token))
-    assert response.status_code == 200
-    response_data = response.json()
+    response_data = await request_ok(
+        async_client, "GET", "/notifications", headers=carereceiver_headers
+    )
 
     # Check response structure
     assert "notifications" in response_data
@@ -574,31 +399,27 @@ def test_get_notifications_with_total_count(client, register_user):
     assert response_data["offset"] == 0  # Default offset
 
 
-def test_get_notifications_pagination(client, register_user):
+async def test_get_notifications_pagination(async_client, linked_users):
     """Test notifications API pagination with limit and offset."""
-    users = setup_linked_users(client, register_user)
-    caregiver_token = users["caregiver"]["token"]
-    carereceiver_token = users["carereceiver"]["token"]
-
-    # Create multiple tasks to generate notifications
-    for i in range(5):
-        task_payload = {
-            "title": f"Test Task {i+1}",
-            "icon": "check",
-            "reminder_time": {"hour": 9, "minute": 0},
-            "recurrence": None,
-        }
-        create_resp = client.post(
-            "/tasks", json=task_payload, headers=auth_headers(caregiver_token)
-        )
-        assert create_resp.status_code == 200
+    caregiver_headers = linked_users["caregiver"]["headers"]
+    carereceiver_headers = linked_users["carereceiver"]["headers"]
+
+    # Create multiple tasks in one request to generate notifications
+    await request_ok(
+        async_client,
+        "POST",
+        "/tasks/bulk",
+        json=[{**TASK_PAYLOAD, "title": f"Test Task {i+1}"} for i in range(5)],
+        headers=caregiver_headers,
+    )
 
     # Get first page with limit 2
-    response = client.get(
-        "/notifications?limit=2&offset=0", headers=auth_headers(carereceiver_token)
+    response_data = await request_ok(
+        async_client,
+        "GET",
+        "/notifications?limit=2&offset=0",
+        headers=carereceiver_headers,
     )
-    assert response.status_code == 200
-    response_data = response.json()
 
     assert response_data["total"] >= 5
     assert len(response_data["notifications"]) == 2
@@ -606,11 +427,12 @@ def test_get_notifications_pagination(client, register_user):
     assert response_data["offset"] == 0
 
     # Get second page
-    response2 = client.get(
-        "/notifications?limit=2&offset=2", headers=auth_headers(carereceiver_token)
+    response_data2 = await request_ok(
+        async_client,
+        "GET",
+        "/notifications?limit=2&offset=2",
+        headers=carereceiver_headers,
     )
-    assert response2.status_code == 200
-    response_data2 = response2.json()
 
     assert response_data2["total"] >= 5
     assert len(response_data2["notifications"]) == 2
@@ -623,28 +445,36 @@ def test_get_notifications_pagination(client, register_user):
     assert first_page_ids.isdisjoint(second_page_ids)  # No overlap
 
 
-def test_no_self_notification(client, register_user):
-    """Test that users don't receive notifications for their own actions."""
-    users = setup_linked_users(client, register_user)
-    caregiver_token = users["caregiver"]["token"]
-
-    # Create task as caregiver
-    task_payload = {
-        "title": "Test Task",
-        "icon": "check",
-        "reminder_time": {"hour": 9, "minute": 0},
-        "recurrence": None,
+async def test_get_notifications_query_count(
+    async_client, linked_users, seeded_notifications, assert_max_queries
+):
+    """Test the notification list is fetched with a fixed number of queries."""
+    # Auth, one page SELECT and one COUNT, however many notifications there are
+    with assert_max_queries(3):
+        response_data = await request_ok(
+            async_client,
+            "GET",
+            "/notifications",
+            headers=linked_users["carereceiver"]["headers"],
+        )
+    assert response_data["total"] == len(seeded_notifications)
+    assert {n["id"] for n in response_data["notifications"]} == set(
+        seeded_notifications
+    )
+
+
+async def test_notifications_query_uses_index(linked_users):
+    """Test the notification list query is served by an index without a filesort."""
+    # Refresh the table statistics so the plan does not depend on earlier tests
+    execute_query("ANALYZE TABLE notifications")
+    plan = execute_query(
+        "EXPLAIN SELECT * FROM notifications WHERE user_id = %s "
+        "ORDER BY created_at DESC LIMIT %s",
+        (linked_users["caregiver"]["id"], 50),
+    )[0]
+    assert plan["key"] in {
+        "idx_notifications_user_id",
+        "idx_notifications_user_unread",
     }
-    create_resp = client.post(
-        "/tasks", json=task_payload, headers=auth_headers(caregiver_token)
-    )
-    assert create_resp.status_code == 200
-
-    # Check that caregiver doesn't receive notification for their own action
-    response = client.get("/notifications", headers=auth_headers(caregiver_token))
-    assert response.status_code == 200
-    response_data = response.json()
-    assert "notifications" in response_data
-    notif_list = response_data["notifications"]
-    # Should not have any notifications for own actions
-    assert not any("created a new task" in n["message"] for n in notif_list)
+    # The index already returns rows in created_at order
+    assert "filesort" not in (plan["Extra"] or "")
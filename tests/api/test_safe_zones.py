@@ -4,7 +4,7 @@ import pytest
 from fastapi import status
 
 from app.schemas.user import Role
-from tests.conftest import auth_headers
+from tests.conftest import auth_headers, link_users_directly
 
 logger = logging.getLogger(__name__)
 
@@ -16,12 +16,8 @@ def register_and_link_users(client, register_user):
     # register as carereceiver, but will be updated to caregiver when accepting invitation
     cg_email, cg_token, cg_id = register_user(Role.CARERECEIVER)
 
-    # caregiver generates invitation
-    resp = client.post("/user/invitations/generate", headers=auth_headers(cr_token))
-    code = resp.json()["invitation_code"]
-
-    # carereceiver accepts invitation
-    client.post(f"/user/invitations/{code}/accept", headers=auth_headers(cg_token))
+    # caregiver accepts carereceiver's invitation
+    link_users_directly(cr_id, cg_id)
     return {
         "carereceiver": {"email": cr_email, "token": cr_token, "id": cr_id},
         "caregiver": {"email": cg_email, "token": cg_token, "id": cg_id},
@@ -1,19 +1,23 @@
-import uuid
-
+import pytest
 from fastapi import status
 from nanoid import generate
 
+from app.api.task import MAX_BULK_TASKS
 from app.schemas.user import Role
+from tests.conftest import fake_email, fake_uuid
+
+# Notifications are covered by test_notification.py
+pytestmark = pytest.mark.usefixtures("no_task_notifications")
 
 
 class TestTaskAPI:
     """Test group for task API endpoints (CRUD, status, error, edge cases)."""
 
     def _register_and_login(self, client, user_id=None):
-        email = f"task_{generate(size=8)}@example.com"
+        email = fake_email()
         password = "test123456"
         if user_id is None:
-            user_id = str(uuid.uuid4())
+            user_id = fake_uuid()
         user_data = {
             "email": email,
             "password": password,
@@ -23,9 +27,8 @@ class TestTaskAPI:
         }
         reg = client.post("/auth/register", json=user_data)
         assert reg.status_code == status.HTTP_201_CREATED
-        login = client.post("/auth/login", json={"email": email, "password": password})
-        assert login.status_code == status.HTTP_200_OK
-        token = login.json()["access_token"]
+        # Registration already issues a token; login is covered by test_auth.py
+        token = reg.json()["access_token"]
         return email, token, user_id
 
     def _auth_headers(self, token):
@@ -70,6 +73,43 @@ class TestTaskAPI:
         tasks = response_data["tasks"] if "tasks" in response_data else response_data
         assert any(t["id"] == created["task"]["id"] for t in tasks)
 
+    def test_create_tasks_bulk(self, client):
+        """Success: create several tasks in one request."""
+        _, token, _ = self._register_and_login(client)
+        reqs = [
+            {
+                "title": f"Task {i + 1}",
+                "icon": "💊",
+                "reminder_time": {"hour": 8, "minute": i},
+            }
+            for i in range(3)
+        ]
+        resp = client.post("/tasks/bulk", json=reqs, headers=self._auth_headers(token))
+        assert resp.status_code == status.HTTP_200_OK
+        created = self._get_response_data(resp)["tasks"]
+        assert [t["title"] for t in created] == ["Task 1", "Task 2", "Task 3"]
+        # All of them are stored
+        resp = client.get("/tasks", headers=self._auth_headers(token))
+        assert resp.status_code == status.HTTP_200_OK
+        stored_ids = {t["id"] for t in self._get_response_data(resp)["tasks"]}
+        assert {t["id"] for t in created} <= stored_ids
+
+    def test_create_tasks_bulk_empty(self, client):
+        """Fail: bulk create with an empty list."""
+        _, token, _ = self._register_and_login(client)
+        resp = client.post("/tasks/bulk", json=[], headers=self._auth_headers(token))
+        assert resp.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_create_tasks_bulk_too_many(self, client):
+        """Fail: bulk create with more tasks than allowed in one request."""
+        _, token, _ = self._register_and_login(client)
+        reqs = [
+            {"title": "Task", "icon": "💊", "reminder_time": {"hour": 8, "minute": 0}}
+        ] * (MAX_BULK_TASKS + 1)
+        resp = client.post("/tasks/bulk", json=reqs, headers=self._auth_headers(token))
+        assert resp.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert "cannot be empty" in resp.json()["detail"]
+
     def test_get_tasks_no_auth(self, client):
         """Fail: get tasks without authentication (should fail)."""
         resp = client.get("/tasks")
@@ -264,7 +304,7 @@ class TestTaskAPI:
 
     def test_tasks_anonymous_id_success(self, client):
         """Success: anonymous id can create and get tasks before registration."""
-        anon_id = str(uuid.uuid4())
+        anon_id = fake_uuid()
         # Create task as anonymous
         req = {
             "title": "Anon Task",
@@ -280,9 +320,15 @@ class TestTaskAPI:
         data = resp.json()
         assert any(t["title"] == "Anon Task" for t in data["tasks"])
 
+    def test_tasks_anonymous_invalid_id(self, client):
+        """Fail: anonymous id must be a valid UUID."""
+        resp = client.get("/tasks", params={"id": "not-a-uuid"})
+        assert resp.status_code == status.HTTP_400_BAD_REQUEST
+        assert "Invalid UUID format" in resp.json()["detail"]
+
     def test_tasks_anonymous_id_after_register_fail(self, client):
         """Fail: cannot use anonymous id after registration, must use token."""
-        anon_id = str(uuid.uuid4())
+        anon_id = fake_uuid()
         # Create task as anonymous
         req = {
             "title": "Anon Task",
@@ -293,7 +339,7 @@ class TestTaskAPI:
         client.post("/tasks", json=req, params={"id": anon_id})
 
         # Register this id
-        email = f"anon_{generate(size=8)}@example.com"
+        email = fake_email()
         password = "test123456"
         user_data = {
             "email": email,
@@ -310,7 +356,7 @@ class TestTaskAPI:
 
     def test_tasks_both_id_and_token_fail(self, client):
         """Fail: cannot use both id and token."""
-        anon_id = str(uuid.uuid4())
+        anon_id = fake_uuid()
         _, token, _ = self._register_and_login(client, user_id=anon_id)
         resp = client.get(
             "/tasks", params={"id": anon_id}, headers=self._auth_headers(token)
@@ -319,7 +365,7 @@ class TestTaskAPI:
 
     def test_anonymous_to_registered_task_consistency(self, client):
         """Success: tasks created as anonymous are accessible after registration with token."""
-        anon_id = str(uuid.uuid4())
+        anon_id = fake_uuid()
         # Create task as anonymous
         req = {
             "title": "Anon Persist Task",
@@ -330,7 +376,7 @@ class TestTaskAPI:
         client.post("/tasks", json=req, params={"id": anon_id})
 
         # Register and login
-        email = f"persist_{generate(size=8)}@example.com"
+        email = fake_email()
         password = "test123456"
         user_data = {
             "email": email,
@@ -338,9 +384,8 @@ class TestTaskAPI:
             "id": anon_id,
             "role": Role.CARERECEIVER,
         }
-        client.post("/auth/register", json=user_data)
-        login = client.post("/auth/login", json={"email": email, "password": password})
-        token = login.json()["access_token"]
+        reg = client.post("/auth/register", json=user_data)
+        token = reg.json()["access_token"]
 
         # Get tasks with token
         resp = client.get("/tasks", headers={"Authorization": f"Bearer {token}"})
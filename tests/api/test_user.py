@@ -1,10 +1,7 @@
-import uuid
-
 from fastapi import status
-from nanoid import generate
 
 from app.schemas.user import Role, UserDisplayMode, UserTextSize
-from tests.conftest import auth_headers
+from tests.conftest import auth_headers, fake_email, fake_uuid
 
 
 class TestUserMeAPI:
@@ -37,7 +34,7 @@ class TestUserMeAPI:
 
     def test_user_me_no_settings(self, client):
         """Should return default values if user_settings does not exist."""
-        anon_id = str(uuid.uuid4())
+        anon_id = fake_uuid()
         resp = client.get("/user/me", params={"id": anon_id})
         assert resp.status_code == 200
         data = resp.json()
@@ -53,7 +50,7 @@ class TestUserMeAPI:
         assert settings["emergency_contacts"] is None
         assert settings["allow_share_location"] is False
 
-    def test_user_me_linked_content(self, client, register_user):
+    def test_user_me_linked_content(self, client, register_user, assert_max_queries):
         """Should return correct linked user info after linking."""
         caregiver_email, caregiver_token, _ = register_user(Role.CARERECEIVER)
         carereceiver_email, carereceiver_token, _ = register_user(Role.CARERECEIVER)
@@ -66,7 +63,9 @@ class TestUserMeAPI:
             f"/user/invitations/{code}/accept", headers=auth_headers(caregiver_token)
         )
         # Check caregiver's linked
-        resp2 = client.get("/user/me", headers=auth_headers(caregiver_token))
+        # Auth, settings, group lookup (3) and one query for all linked users
+        with assert_max_queries(6):
+            resp2 = client.get("/user/me", headers=auth_headers(caregiver_token))
         linked = resp2.json()["settings"]["linked"]
         assert any(u["email"] == carereceiver_email for u in linked)
         assert all("name" in u for u in linked)
@@ -78,11 +77,11 @@ class TestGetCurrentUser:
     def test_get_current_user_success(self, client):
         """Success: get current user with valid token."""
         # First register a user
-        unique_email = f"test_{generate(size=8)}@example.com"
+        unique_email = fake_email()
         user_data = {
             "email": unique_email,
             "password": "test123456",
-            "id": str(uuid.uuid4()),
+            "id": fake_uuid(),
             "role": Role.CARERECEIVER,
         }
 
@@ -126,7 +125,7 @@ class TestGetCurrentUser:
 
     def test_get_current_user_new_anonymous_id(self, client):
         """Success: new anonymous id creates user and returns user info."""
-        anon_id = str(uuid.uuid4())
+        anon_id = fake_uuid()
         resp = client.get("/user/me", params={"id": anon_id})
         assert resp.status_code == 200
         data = resp.json()
@@ -134,7 +133,7 @@ class TestGetCurrentUser:
 
     def test_get_current_user_existing_anonymous_id(self, client):
         """Success: existing anonymous id (not registered) returns user info."""
-        anon_id = str(uuid.uuid4())
+        anon_id = fake_uuid()
         # First call to create user
         client.get("/user/me", params={"id": anon_id})
         # Second call should return same user
@@ -145,8 +144,8 @@ class TestGetCurrentUser:
 
     def test_get_current_user_registered_id_with_id_fail(self, client):
         """Fail: registered id cannot use id to get current user (must use token)."""
-        user_id = str(uuid.uuid4())
-        unique_email = f"test_{generate(size=8)}@example.com"
+        user_id = fake_uuid()
+        unique_email = fake_email()
         user_data = {
             "email": unique_email,
             "password": "test123456",
@@ -160,8 +159,8 @@ class TestGetCurrentUser:
 
     def test_get_current_user_registered_id_with_token_success(self, client):
         """Success: registered id can use token to get current user."""
-        user_id = str(uuid.uuid4())
-        unique_email = f"test_{generate(size=8)}@example.com"
+        user_id = fake_uuid()
+        unique_email = fake_email()
         user_data = {
             "email": unique_email,
             "password": "test123456",
@@ -185,7 +184,7 @@ class TestGetCurrentUser:
 
     def test_get_current_user_both_id_and_token_fail(self, client):
         """Fail: both id and token should fail."""
-        anon_id = str(uuid.uuid4())
+        anon_id = fake_uuid()
         headers = {"Authorization": "Bearer invalid_token"}
         resp = client.get("/user/me", params={"id": anon_id}, headers=headers)
         assert resp.status_code == 400
@@ -373,7 +372,7 @@ class TestUpdateUserSettings:
 
     def test_update_user_settings_anonymous_user(self, client):
         """Success: update settings for anonymous user."""
-        anon_id = str(uuid.uuid4())
+        anon_id = fake_uuid()
 
         # First create anonymous user
         client.get("/user/me", params={"id": anon_id})
@@ -2,6 +2,7 @@ import pytest
 from fastapi import status
 
 from app.schemas.user import Role
+from tests.conftest import link_users_directly
 
 
 @pytest.fixture
@@ -10,17 +11,8 @@ def register_and_link_users(client, register_user):
     cr_email, cr_token, cr_id = register_user(Role.CARERECEIVER)
     cg_email, cg_token, cg_id = register_user(Role.CARERECEIVER)
 
-    # carereceiver generates invitation
-    resp = client.post(
-        "/user/invitations/generate", headers={"Authorization": f"Bearer {cr_token}"}
-    )
-    code = resp.json()["invitation_code"]
-
-    # caregiver accepts invitation
-    client.post(
-        f"/user/invitations/{code}/accept",
-        headers={"Authorization": f"Bearer {cg_token}"},
-    )
+    # caregiver accepts carereceiver's invitation
+    link_users_directly(cr_id, cg_id)
 
     # carereceiver enables allow_share_location
     client.put(
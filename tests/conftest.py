@@ -1,13 +1,98 @@
+import asyncio
+import itertools
+import logging
 import os
+import sys
 import uuid
+from contextlib import contextmanager
+from functools import lru_cache
+from types import MappingProxyType
 
 import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
-from nanoid import generate
+from httpx import ASGITransport, AsyncClient
 
+from app.api import auth as auth_api
+from app.api.testing import TEST_PASSWORD, link_by_invitation
+from app.core import database
+from app.core.config import settings
 from app.main import app
+from app.repositories import user as user_repository
 from app.schemas.user import Role
+from app.services import security
+from app.services.notification_manager import NotificationManager
+from scripts._db import server_connection
+from scripts.init_db import create_tables
+from tests.test_config import TEST_DATABASE_NAME
+
+# bcrypt's minimum cost; hashes stay real bcrypt so login still verifies them
+TEST_BCRYPT_ROUNDS = 4
+
+# Cheap unique test ids: one random prefix per run (so ids don't collide with rows
+# left by earlier runs) plus a counter
+_RUN_PREFIX = uuid.uuid4().hex[:8]
+_seq = itertools.count()
+
+
+def fake_uuid():
+    """Return a unique, valid UUID string for test data."""
+    return f"{_RUN_PREFIX}-0000-4000-8000-{next(_seq):012d}"
+
+
+def fake_email():
+    """Return a unique email address for test data."""
+    return f"test_{_RUN_PREFIX}_{next(_seq)}@example.com"
+
+
+def register_payload(**overrides):
+    """Return a valid /auth/register body with fresh id and email, plus overrides."""
+    return {
+        "email": fake_email(),
+        "password": TEST_PASSWORD,
+        "id": fake_uuid(),
+        "role": Role.CARERECEIVER,
+        **overrides,
+    }
+
+
+@pytest.fixture(scope="session", autouse=True)
+def quiet_info_logging():
+    """Skip INFO and lower logs (per-request access logs, user setup logs) while
+    testing. Warnings and errors are still emitted."""
+    logging.disable(logging.INFO)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def worker_database():
+    """Give each pytest-xdist worker its own copy of the test database."""
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    if not worker:
+        yield
+        return
+
+    database = f"{TEST_DATABASE_NAME}_{worker}"
+    with server_connection() as connection:
+        cursor = connection.cursor()
+        cursor.execute(
+            f"DROP DATABASE IF EXISTS {database}; CREATE DATABASE {database}"
+        )
+        while cursor.nextset():
+            pass
+        cursor.close()
+        assert create_tables(connection=connection, database=database)
+
+    original_database = settings.db_name
+    settings.db_name = database
+    yield
+    settings.db_name = original_database
+
+    with server_connection() as connection:
+        cursor = connection.cursor()
+        cursor.execute(f"DROP DATABASE IF EXISTS {database}")
+        cursor.close()
 
 
 @pytest.fixture(autouse=True)
@@ -17,43 +102,177 @@ def setup_testing_environment():
     os.environ.pop("TESTING", None)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session", autouse=True)
+def fast_password_hashing():
+    """Make test password hashing cheap (production config is untouched)."""
+    original_rounds = settings.bcrypt_rounds
+    settings.bcrypt_rounds = TEST_BCRYPT_ROUNDS
+    # Nearly every test user has TEST_PASSWORD, so hash it once and reuse the hash
+    test_password_hash = security.get_password_hash(TEST_PASSWORD)
+
+    def get_password_hash(password):
+        if password == TEST_PASSWORD:
+            return test_password_hash
+        return security.get_password_hash(password)
+
+    def verify_password(plain_password, hashed_password):
+        if plain_password == TEST_PASSWORD and hashed_password == test_password_hash:
+            return True
+        # Wrong passwords still go through the real check
+        return security.verify_password(plain_password, hashed_password)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(user_repository, "get_password_hash", get_password_hash)
+        mp.setattr(auth_api, "verify_password", verify_password)
+        yield
+    settings.bcrypt_rounds = original_rounds
+
+
+@pytest.fixture(scope="session")
 def client():
-    """Fixture for FastAPI test client."""
+    """Fixture for FastAPI test client, shared by the whole test session.
+    Tests register their own uniquely named users, so no state is reset between them."""
     with TestClient(app) as c:
         yield c
 
 
+@pytest.fixture(scope="session")
+def anyio_backend():
+    """Run `pytest.mark.anyio` tests on asyncio only."""
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+async def async_client(anyio_backend):
+    """Async test client that calls the ASGI app directly (no thread portal)."""
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as c:
+        yield c
+
+
+@pytest.fixture
+def no_task_notifications(monkeypatch):
+    """
+    Skip task notifications for tests that don't check them.
+    test_notification.py doesn't use this, so it still covers the real path.
+    """
+    for name in ("notify_task_group", "notify_task_group_bulk"):
+        monkeypatch.setattr(
+            NotificationManager, name, staticmethod(lambda **kwargs: None)
+        )
+
+
+# The helpers in app.core.database that each run one statement (or one batch)
+DATABASE_CALLS = (
+    "execute_query",
+    "execute_update",
+    "execute_many",
+    "execute_prepared_query",
+)
+
+
+@pytest.fixture
+def assert_max_queries(monkeypatch):
+    """
+    Return a context manager that fails if its block runs more than n queries.
+    Counts calls to the app.core.database helpers, so N+1 regressions in list
+    endpoints show up as a failing test.
+    """
+    count = 0
+
+    def counted(func):
+        def wrapper(*args, **kwargs):
+            nonlocal count
+            count += 1
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    # Read before patching: once app.core.database itself is patched, modules
+    # later in sys.modules would no longer match its attributes
+    originals = {call: getattr(database, call) for call in DATABASE_CALLS}
+    # Repositories import the helpers by name, so patch every module's reference
+    for name, module in list(sys.modules.items()):
+        if name != "app" and not name.startswith("app."):
+            continue
+        for call, func in originals.items():
+            if getattr(module, call, None) is func:
+                monkeypatch.setattr(module, call, counted(func))
+
+    @contextmanager
+    def _assert_max_queries(n):
+        nonlocal count
+        count = 0
+        yield
+        assert count <= n, f"Expected at most {n} queries, {count} were run"
+
+    return _assert_max_queries
+
+
 @pytest.fixture
 def register_user(client):
     """Register a user and return (email, token, user_id)."""
 
     def _register(role, email=None, user_id=None):
         if not email:
-            email = f"test_{generate(size=8)}@example.com"
+            email = fake_email()
         if not user_id:
-            user_id = str(uuid.uuid4())
+            user_id = fake_uuid()
         user_data = {
             "email": email,
-            "password": "test123456",
+            "password": TEST_PASSWORD,
             "id": user_id,
             "role": role,
         }
         reg = client.post("/auth/register", json=user_data)
         assert reg.status_code == status.HTTP_201_CREATED
-        login = client.post(
-            "/auth/login", json={"email": email, "password": "test123456"}
-        )
-        assert login.status_code == status.HTTP_200_OK
-        token = login.json()["access_token"]
+        # Registration already issues a token, so skip the extra login
+        token = reg.json()["access_token"]
         return email, token, user_id
 
     return _register
 
 
+@pytest.fixture
+def async_register_user(async_client):
+    """Async register_user for tests running on async_client."""
+
+    async def _register(role, email=None, user_id=None):
+        user_data = register_payload(role=role)
+        if email:
+            user_data["email"] = email
+        if user_id:
+            user_data["id"] = user_id
+        reg = await async_client.post("/auth/register", json=user_data)
+        assert reg.status_code == status.HTTP_201_CREATED
+        return user_data["email"], reg.json()["access_token"], user_data["id"]
+
+    return _register
+
+
+@lru_cache(maxsize=256)
 def auth_headers(token):
     """Return authorization headers for a given token."""
-    return {"Authorization": f"Bearer {token}"}
+    # Cached per token, so read-only: a caller can't change another test's headers
+    return MappingProxyType({"Authorization": f"Bearer {token}"})
+
+
+async def request_ok(async_client, method, url, expect=200, **kwargs):
+    """Send a request, check its status code and return the parsed body."""
+    resp = await async_client.request(method, url, **kwargs)
+    assert resp.status_code == expect, resp.text
+    return resp.json()
+
+
+async def get_task_lists(async_client, *tokens):
+    """Fetch GET /tasks for several users concurrently, one task list per token."""
+    responses = await asyncio.gather(
+        *(async_client.get("/tasks", headers=auth_headers(token)) for token in tokens)
+    )
+    for resp in responses:
+        assert resp.status_code == status.HTTP_200_OK
+    return [resp.json()["tasks"] for resp in responses]
 
 
 def create_link_by_invitation(client, inviter_token, invitee_token):
@@ -69,6 +288,16 @@ def create_link_by_invitation(client, inviter_token, invitee_token):
     assert resp2.status_code == 200
 
 
+def link_users_directly(inviter_id, invitee_id):
+    """
+    Link two carereceivers through the service layer, skipping HTTP.
+    Same end state as the invitee accepting the inviter's invitation: the invitee
+    becomes the caregiver. Use create_link_by_invitation to test the endpoints.
+    """
+    success, message = link_by_invitation(inviter_id, invitee_id)
+    assert success, message
+
+
 @pytest.fixture
 def register_and_link_users(client, register_user):
     """Register a carereceiver and caregiver, link them, and return their info."""
@@ -76,14 +305,8 @@ def register_and_link_users(client, register_user):
     # register as carereceiver, but will be updated to caregiver when accepting invitation
     cg_email, cg_token, cg_id = register_user(Role.CARERECEIVER)
 
-    # carereceiver generates invitation
-    resp = client.post("/user/invitations/generate", headers=auth_headers(cr_token))
-    code = resp.json()["invitation_code"]
-
-    # caregiver accepts invitation
-    resp = client.post(
-        f"/user/invitations/{code}/accept", headers=auth_headers(cg_token)
-    )
+    # caregiver accepts carereceiver's invitation
+    link_users_directly(cr_id, cg_id)
 
     # carereceiver enables allow_share_location
     client.put(